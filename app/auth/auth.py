@@ -1,75 +1,86 @@
+import asyncio
+import dataclasses
 import os
 from typing import Optional, Any
 from fastapi import HTTPException, Request, Security
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from clerk_backend_api import Clerk
-from clerk_backend_api.security.types import AuthenticateRequestOptions
-import httpx
+from clerk_backend_api.security import VerifyTokenOptions, verify_token as verify_session_token
 from ..config.logging_config import configure_logging
+from .service import clerk_secret_key, get_jwt_key
+from .token_cache import token_cache
 
 _LOGGER = configure_logging()
 
 # Initialize security scheme
 security = HTTPBearer()
 
-# Initialize Clerk SDK
-clerk_client = Clerk(bearer_auth=os.getenv('CLERK_SECRET_KEY'))
 frontend_url = os.getenv('FRONTEND_URL', '')
 if not frontend_url:
     raise ValueError("FRONTEND_URL environment variable not set")
 
-def verify_token(request: Request, credentials: HTTPAuthorizationCredentials = Security(security)) -> dict[str, Any]:
+# Browser traffic from our own frontend is the common case; share its options across requests
+_DEFAULT_PARTIES = frozenset((frontend_url,))
+_DEFAULT_OPTIONS = VerifyTokenOptions(authorized_parties=list(_DEFAULT_PARTIES), secret_key=clerk_secret_key)
+
+
+def _authorized_parties(origin: str | None, referer: str | None) -> frozenset[str]:
+	if (not origin or origin == frontend_url) and (not referer or referer.startswith(frontend_url)):
+		return _DEFAULT_PARTIES
+	return frozenset((frontend_url, *filter(None, (origin, referer))))
+
+
+def _session_claims(payload: dict[str, Any]) -> dict[str, Any]:
+	return {
+		"user_id": payload.get("sub"),
+		"email": payload.get("email"),
+		"claims": payload
+	}
+
+
+def authenticate_token(token: str, origin: str | None = None, referer: str | None = None) -> dict[str, Any]:
 	"""
-	Verify the Clerk session token from the Authorization header.
-	
+	Verify a raw Clerk session token against the frontend and request origins.
+	Blocking; async callers should run it in a worker thread.
+
 	Returns:
 		dict: Decoded token payload with user information
-		
+
 	Raises:
 		HTTPException: If token is invalid or expired
 	"""
-	if not credentials:
-		_LOGGER.warning("Missing authentication credentials")
-		raise HTTPException(status_code=401, detail="Not authenticated")
 	try:
-		# Get origin and referer from headers
-		origin = request.headers.get("origin")
-		referer = request.headers.get("referer")
-		
-		# Build the list of authorized parties
-		authorized_parties = [frontend_url]
-		if origin:
-			authorized_parties.append(origin)
-		if referer:
-			authorized_parties.append(referer)
+		# Build the list of authorized parties from origin and referer headers
+		authorized_parties = _authorized_parties(origin, referer)
+
+		# Serve previously verified, unexpired tokens from memory
+		cached = token_cache.get(token, authorized_parties)
+		if cached is not None:
+			return _session_claims(cached)
 			
-		# Create an httpx.Request object with the authorization header
-		httpx_req = httpx.Request(
-			method="GET",
-			url=str(request.url),
-			headers={"Authorization": f"Bearer {credentials.credentials}"}
-		)
-		
-		# Authenticate the request
-		options = AuthenticateRequestOptions(
-			authorized_parties=authorized_parties
-		)
-		request_state = clerk_client.authenticate_request(httpx_req, options)
+		# Verify the raw JWT directly; no need to wrap it in a synthetic HTTP request
+		if authorized_parties is _DEFAULT_PARTIES:
+			options = _DEFAULT_OPTIONS
+		else:
+			options = VerifyTokenOptions(
+				authorized_parties=list(authorized_parties),
+				secret_key=clerk_secret_key
+			)
+		# A cached signing key makes verification networkless
+		jwt_key = get_jwt_key(token)
+		if jwt_key is not None:
+			options = dataclasses.replace(options, jwt_key=jwt_key)
+		payload = verify_session_token(token, options)
 		
-		# Check if user is signed in
-		if not request_state.is_signed_in or not request_state.payload:
-			_LOGGER.warning(f"User not signed in or no payload. SignedIn: {request_state.is_signed_in}")
+		if not payload:
+			_LOGGER.warning("Token verified without a payload")
 			raise HTTPException(
 				status_code=401,
 				detail="Not authenticated"
 			)
+		token_cache.put(token, payload)
 		
 		# Return the claims from the token
-		return {
-			"user_id": request_state.payload.get("sub"),
-			"email": request_state.payload.get("email"),
-			"claims": request_state.payload
-		}
+		return _session_claims(payload)
 		
 	except Exception as e:
 		_LOGGER.error(f"Authentication failed: {str(e)}", exc_info=True)
@@ -79,6 +90,26 @@ def verify_token(request: Request, credentials: HTTPAuthorizationCredentials = S
 		)
 
 
+def verify_token(request: Request, credentials: HTTPAuthorizationCredentials = Security(security)) -> dict[str, Any]:
+	"""
+	Verify the Clerk session token from the Authorization header.
+	Reuses the claims already resolved by `get_auth` for this request.
+	
+	Returns:
+		dict: Decoded token payload with user information
+		
+	Raises:
+		HTTPException: If token is invalid or expired
+	"""
+	if not credentials:
+		_LOGGER.warning("Missing authentication credentials")
+		raise HTTPException(status_code=401, detail="Not authenticated")
+	resolved = getattr(request.state, "auth", None)
+	if resolved is not None:
+		return resolved
+	return authenticate_token(credentials.credentials, request.headers.get("origin"), request.headers.get("referer"))
+
+
 def get_current_user(request: Request, credentials: HTTPAuthorizationCredentials = Security(security)) -> dict[str, Any]:
 	"""
 	Dependency to get current authenticated user.
@@ -87,18 +118,21 @@ def get_current_user(request: Request, credentials: HTTPAuthorizationCredentials
 	return verify_token(request, credentials)
 
 
-async def get_current_user_optional(
-    request: Request,
-    credentials: Optional[HTTPAuthorizationCredentials] = Security(security)
-) -> Optional[dict[str, Any]]:
+async def get_current_user_optional(request: Request) -> Optional[dict[str, Any]]:
     """
     Optional authentication dependency.
     Returns user info if authenticated, None otherwise.
+    Reads the header directly so anonymous requests skip the HTTPBearer dependency.
     """
-    if credentials is None:
+    resolved = getattr(request.state, "auth", None)
+    if resolved is not None:
+        return resolved
+    scheme, _, token = (request.headers.get("authorization") or "").partition(" ")
+    if scheme.lower() != "bearer" or not token:
         return None
     
     try:
-        return verify_token(request, credentials)
+        # authenticate_token is blocking; keep it off the event loop
+        return await asyncio.to_thread(authenticate_token, token, request.headers.get("origin"), request.headers.get("referer"))
     except HTTPException:
-        return None
\ No newline at end of file
+        return None
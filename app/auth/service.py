@@ -1,7 +1,83 @@
 from __future__ import annotations
 
+import logging
 import os
+import threading
 
+import httpx
+import jwt
 from clerk_backend_api import Clerk
+from cryptography.hazmat.primitives import serialization
+from jwt.algorithms import RSAAlgorithm
 
-clerk_client = Clerk(bearer_auth=os.environ.get("CLERK_SECRET_KEY"))
+# One keep-alive pool shared by every outbound auth call; closed on app shutdown
+http_client = httpx.Client(
+	follow_redirects=True,
+	timeout=15.0,
+	limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+clerk_secret_key = os.environ.get("CLERK_SECRET_KEY")
+clerk_client = Clerk(bearer_auth=clerk_secret_key, client=http_client)
+
+# Session-token signing keys by `kid`, as PEM; filled from the JWKS endpoint over the pooled client
+_jwt_keys: dict[str, str] = {}
+_jwt_keys_lock = threading.Lock()
+
+
+def close_http_client() -> None:
+	http_client.close()
+
+
+def _refresh_jwt_keys() -> None:
+	jwks = clerk_client.jwks.get_jwks()
+	keys: dict[str, str] = {}
+	for key in jwks.keys or []:
+		if not key.kid or key.kty != "RSA":
+			continue
+		public_key = RSAAlgorithm.from_jwk(key.model_dump(exclude_none=True))
+		keys[key.kid] = public_key.public_bytes(
+			encoding=serialization.Encoding.PEM,
+			format=serialization.PublicFormat.SubjectPublicKeyInfo,
+		).decode()
+	with _jwt_keys_lock:
+		_jwt_keys.update(keys)
+
+
+def get_jwt_key(token: str) -> str | None:
+	"""
+	Return the PEM key that signed a session token, fetching the JWKS once on an unknown `kid`.
+	None means the key could not be resolved; verification then falls back to the SDK's own lookup.
+	"""
+	if not clerk_secret_key:
+		return None
+	try:
+		kid = jwt.get_unverified_header(token).get("kid")
+	except jwt.InvalidTokenError:
+		return None
+	if not kid:
+		return None
+	key = _jwt_keys.get(kid)
+	if key is None:
+		try:
+			_refresh_jwt_keys()
+		except Exception as e:
+			_LOGGER.warning(f"Clerk JWKS fetch failed: {e}")
+			return None
+		key = _jwt_keys.get(kid)
+	return key
+
+
+def prewarm_jwt_keys() -> None:
+	"""
+	Load the Clerk signing keys that session verification reads, ahead of the first user request.
+	Failures are logged and ignored; keys are then fetched on first use.
+	"""
+	if not clerk_secret_key:
+		return
+	try:
+		_refresh_jwt_keys()
+	except Exception as e:
+		_LOGGER.warning(f"Clerk prewarm failed: {e}")
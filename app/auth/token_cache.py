@@ -0,0 +1,60 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Any
+
+
+class TokenCache:
+	"""
+	Bounded LRU of verified Clerk session claims keyed by a digest of the raw token.
+	Entries expire with the token's own `exp` claim.
+	"""
+
+	def __init__(self, maxsize: int = 10_000) -> None:
+		self.maxsize = max(1, maxsize)
+		self._entries: OrderedDict[bytes, tuple[dict[str, Any], float]] = OrderedDict()
+		self._lock = threading.Lock()
+
+	@staticmethod
+	def _key(token: str) -> bytes:
+		return hashlib.blake2b(token.encode("utf-8"), digest_size=16).digest()
+
+	def get(self, token: str, authorized_parties: Iterable[str]) -> dict[str, Any] | None:
+		key = self._key(token)
+		with self._lock:
+			entry = self._entries.get(key)
+			if entry is None:
+				return None
+			claims, exp = entry
+			if exp <= time.time():
+				del self._entries[key]
+				return None
+			self._entries.move_to_end(key)
+		# Clerk rejects tokens whose azp is outside the allowlist; mirror that for cached claims
+		azp = claims.get("azp")
+		if azp is not None and azp not in authorized_parties:
+			return None
+		return claims
+
+	def put(self, token: str, claims: dict[str, Any]) -> None:
+		try:
+			exp = float(claims.get("exp") or 0)
+		except (TypeError, ValueError):
+			return
+		if exp <= time.time():
+			return
+		key = self._key(token)
+		with self._lock:
+			self._entries[key] = (claims, exp)
+			self._entries.move_to_end(key)
+			while len(self._entries) > self.maxsize:
+				self._entries.popitem(last=False)
+
+	def clear(self) -> None:
+		with self._lock:
+			self._entries.clear()
+
+
+token_cache = TokenCache()
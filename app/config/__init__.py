@@ -1,2 +1,5 @@
 # This file makes the config directory a package.
-from .logging_config import configure_logging
\ No newline at end of file
+from .config import AppConfig
+from .logging_config import configure_logging
+
+__all__ = ["AppConfig", "configure_logging"]
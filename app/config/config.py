@@ -1,4 +1,6 @@
+import functools
 import os
+from dataclasses import dataclass
 from pathlib import Path
 
 
@@ -9,39 +11,87 @@ def read_env(name: str, default: str | None = None, required: bool = False) -> s
 	return value
 
 
+# Shared default for AGENTIC_CACHE_TTL, the generator and AgentResultCache
+DEFAULT_AGENTIC_CACHE_TTL = 24 * 3600
+_DEFAULT_CONTEXT_PATH = str(Path(__file__).resolve().parent.parent / "review" / "agentic" / "context" / "project_context.json")
+
+
+@dataclass(slots=True, frozen=True)
 class AppConfig:
-	def __init__(self) -> None:
-		base_dir = Path(__file__).resolve().parent
-		self.gitlab_url = read_env("GITLAB_URL", "https://gitlab.com")
-		self.gitlab_token = read_env("GITLAB_TOKEN", required=True)
-		self.webhook_secret = read_env("GITLAB_WEBHOOK_SECRET", required=True)
-		self.webhook_url = read_env("WEBHOOK_URL")
-		self.host = read_env("HOST", "0.0.0.0")
-		self.port = int(read_env("PORT", "8080") or "8080")
-		self.gemini_api_key = read_env("GEMINI_API_KEY")
-		self.gemini_model = read_env("GEMINI_MODEL", "gemini-2.5-pro")
-		self.env = (read_env("ENV", "prod") or "prod").lower()
-		self.label_candidates: list[str] = self._read_label_candidates()
-		self.label_max: int = self._read_label_max()
-		self.jira_url = read_env("JIRA_URL")
-		self.jira_email = read_env("JIRA_EMAIL")
-		self.jira_api_token = read_env("JIRA_API_TOKEN")
-		self.jira_project_keys: list[str] = self._read_jira_projects()
-		self.jira_max_issues: int = int(read_env("JIRA_MAX_ISSUES", "5") or "5")
-		self.jira_search_window: str = read_env("JIRA_SEARCH_WINDOW", "-30d") or "-30d"
-		self.agentic_provider = read_env("AGENTIC_PROVIDER", "google")
+	gitlab_url: str | None
+	gitlab_token: str | None
+	webhook_secret: str | None
+	webhook_url: str | None
+	host: str | None
+	port: int
+	gemini_api_key: str | None
+	gemini_model: str | None
+	env: str
+	label_candidates: list[str]
+	label_max: int
+	jira_url: str | None
+	jira_email: str | None
+	jira_api_token: str | None
+	jira_project_keys: list[str]
+	jira_max_issues: int
+	jira_search_window: str
+	agentic_provider: str | None
+	agentic_model: str | None
+	openai_api_key: str | None
+	google_api_key: str | None
+	project_context_path: str | None
+	agentic_timeout: float
+	agentic_cache_ttl: float
+	clerk_secret_key: str | None
+
+	@classmethod
+	@functools.cache
+	def load(cls) -> "AppConfig":
+		"""Process-wide configuration, read from the environment once."""
+		return cls.from_env()
+
+	@classmethod
+	def from_env(cls) -> "AppConfig":
+		agentic_provider = read_env("AGENTIC_PROVIDER", "google")
 		raw_model = read_env("AGENTIC_MODEL", "models/gemini-2.5-flash")
-		self.agentic_model = self._normalize_model_name(self.agentic_provider, raw_model)
-		self.openai_api_key = read_env("OPENAI_API_KEY")
-		self.google_api_key = read_env("GOOGLE_API_KEY") or self.gemini_api_key
-		default_context = base_dir / "review" / "agentic" / "context" / "project_context.json"
-		self.project_context_path = read_env("PROJECT_CONTEXT_PATH", str(default_context))
+		gemini_api_key = read_env("GEMINI_API_KEY")
 		timeout_raw = read_env("AGENTIC_TIMEOUT", "60")
 		try:
-			self.agentic_timeout = float(timeout_raw or "60")
+			agentic_timeout = float(timeout_raw or "60")
+		except Exception:
+			agentic_timeout = 60.0
+		cache_ttl_raw = read_env("AGENTIC_CACHE_TTL")
+		try:
+			agentic_cache_ttl = max(0.0, float(cache_ttl_raw or DEFAULT_AGENTIC_CACHE_TTL))
 		except Exception:
-			self.agentic_timeout = 60.0
-		self.clerk_secret_key = read_env("CLERK_SECRET_KEY", required=True)
+			agentic_cache_ttl = float(DEFAULT_AGENTIC_CACHE_TTL)
+		return cls(
+			gitlab_url=read_env("GITLAB_URL", "https://gitlab.com"),
+			gitlab_token=read_env("GITLAB_TOKEN", required=True),
+			webhook_secret=read_env("GITLAB_WEBHOOK_SECRET", required=True),
+			webhook_url=read_env("WEBHOOK_URL"),
+			host=read_env("HOST", "0.0.0.0"),
+			port=int(read_env("PORT", "8080") or "8080"),
+			gemini_api_key=gemini_api_key,
+			gemini_model=read_env("GEMINI_MODEL", "gemini-2.5-pro"),
+			env=(read_env("ENV", "prod") or "prod").lower(),
+			label_candidates=cls._read_label_candidates(),
+			label_max=cls._read_label_max(),
+			jira_url=read_env("JIRA_URL"),
+			jira_email=read_env("JIRA_EMAIL"),
+			jira_api_token=read_env("JIRA_API_TOKEN"),
+			jira_project_keys=cls._read_jira_projects(),
+			jira_max_issues=int(read_env("JIRA_MAX_ISSUES", "5") or "5"),
+			jira_search_window=read_env("JIRA_SEARCH_WINDOW", "-30d") or "-30d",
+			agentic_provider=agentic_provider,
+			agentic_model=cls._normalize_model_name(agentic_provider, raw_model),
+			openai_api_key=read_env("OPENAI_API_KEY"),
+			google_api_key=read_env("GOOGLE_API_KEY") or gemini_api_key,
+			project_context_path=read_env("PROJECT_CONTEXT_PATH", _DEFAULT_CONTEXT_PATH),
+			agentic_timeout=agentic_timeout,
+			agentic_cache_ttl=agentic_cache_ttl,
+			clerk_secret_key=read_env("CLERK_SECRET_KEY", required=True),
+		)
 
 	@staticmethod
 	def _normalize_model_name(provider: str | None, model: str | None) -> str | None:
@@ -51,14 +101,16 @@ class AppConfig:
 			return f"models/{model}"
 		return model
 
-	def _read_label_candidates(self) -> list[str]:
+	@staticmethod
+	def _read_label_candidates() -> list[str]:
 		raw = read_env("LABEL_CANDIDATES", "")
 		if not raw:
 			return []
 		cands = [c.strip() for c in raw.split(",")]
 		return [c for c in cands if c]
 	
-	def _read_label_max(self) -> int:
+	@staticmethod
+	def _read_label_max() -> int:
 		raw = read_env("LABEL_MAX", "2")
 		try:
 			val = int(raw or "2")
@@ -66,10 +118,9 @@ class AppConfig:
 			val = 2
 		return max(1, min(val, 5))
 
-	def _read_jira_projects(self) -> list[str]:
+	@staticmethod
+	def _read_jira_projects() -> list[str]:
 		raw = read_env("JIRA_PROJECT_KEYS", "")
 		if not raw:
 			return ["KZKP"]
 		return [p.strip() for p in raw.split(",") if p.strip()]
-
-
@@ -1,10 +1,15 @@
 import logging
 import os
 
+_ROOT_LOGGER: logging.Logger | None = None
+
 
 def configure_logging() -> logging.Logger:
+	global _ROOT_LOGGER
+	if _ROOT_LOGGER is not None:
+		return _ROOT_LOGGER
 	level_name = os.environ.get("LOG_LEVEL", "DEBUG").upper()
-	logging.basicConfig(level=level_name, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
-	return logging.getLogger()
-
-
+	level = logging.getLevelNamesMapping().get(level_name, logging.INFO)
+	logging.basicConfig(level=level, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+	_ROOT_LOGGER = logging.getLogger()
+	return _ROOT_LOGGER
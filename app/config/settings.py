@@ -1,3 +1,3 @@
 from .config import AppConfig
 
-settings = AppConfig()
\ No newline at end of file
+settings = AppConfig.load()
\ No newline at end of file
@@ -1 +1 @@
-__all__ = ["jira_service"]
+__all__ = ["gemini_client", "jira_service"]
@@ -0,0 +1,29 @@
+import threading
+from typing import Any
+
+try:
+	import google.generativeai as genai  # type: ignore
+except Exception:  # pragma: no cover
+	genai = None  # type: ignore
+
+# genai.configure mutates module-global client state; only redo it when the key changes
+_LOCK = threading.Lock()
+_configured_key: str | None = None
+_MODELS: dict[tuple[str, str], Any] = {}
+
+
+def get_model(api_key: str, name: str) -> Any:
+	"""
+	Shared GenerativeModel per (api key, model name), so callers skip SDK setup on every request.
+	"""
+	global _configured_key
+	if genai is None:
+		raise RuntimeError("google-generativeai is not installed")
+	with _LOCK:
+		if _configured_key != api_key:
+			genai.configure(api_key=api_key)
+			_configured_key = api_key
+		model = _MODELS.get((api_key, name))
+		if model is None:
+			model = _MODELS[(api_key, name)] = genai.GenerativeModel(name)
+		return model
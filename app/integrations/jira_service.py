@@ -1,5 +1,11 @@
-import json
+import itertools
+import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+
+import orjson
+from requests.adapters import HTTPAdapter
 
 from ..config.logging_config import configure_logging
 
@@ -10,6 +16,46 @@ except Exception:  # pragma: no cover
 
 _LOGGER = configure_logging()
 
+_TOKEN_RE = re.compile(r"[A-Za-z0-9_]+")
+_STOPWORDS: frozenset[str] = frozenset((
+	"the", "and", "for", "with", "from", "that", "this", "which", "into", "over", "under", "your",
+	"their", "our", "are", "was", "were", "have", "has", "had", "you", "him", "her", "its", "they",
+	"them", "can", "could", "should", "would", "about", "after", "before", "onto",
+))
+# Each f-string query compiles to a single BUILD_STRING, so the whole JQL is one allocation
+_JQL_ORDER = " ORDER BY updated DESC"
+_SEARCH_FIELD_NAMES = ("summary", "status", "updated")
+_SEARCH_FIELDS = frozenset(_SEARCH_FIELD_NAMES)
+# Single-pass escaping of backslashes and quotes inside JQL string literals
+_JQL_ESCAPE = str.maketrans({"\\": "\\\\", '"': '\\"'})
+
+_SEARCH_CACHE_TTL_SECONDS = 90.0
+_SEARCH_CACHE_MAXSIZE = 512
+_SEARCH_CACHE: dict[tuple, tuple[float, list[dict[str, str]]]] = {}
+_SEARCH_CACHE_LOCK = threading.Lock()
+
+def _to_adf(text: str) -> dict:
+	"""
+	Convert plain text to a fresh Atlassian Document Format doc.
+	"""
+	paras = [p for p in text.split("\n\n") if p.strip()]
+	content = []
+	for p in paras:
+		# Preserve newlines within paragraph as hardBreaks
+		segments = p.split("\n")
+		inner = []
+		for idx, seg in enumerate(segments):
+			if seg:
+				inner.append({"type": "text", "text": seg})
+			if idx < len(segments) - 1:
+				inner.append({"type": "hardBreak"})
+		if not inner:
+			inner = [{"type": "text", "text": ""}]
+		content.append({"type": "paragraph", "content": inner})
+	if not content:
+		content = [{"type": "paragraph", "content": [{"type": "text", "text": ""}]}]
+	return {"type": "doc", "version": 1, "content": content}
+
 
 class JiraService:
 	def __init__(self, base_url: str, email: str, api_token: str, project_keys: list[str] | None = None, max_issues: int = 5, search_window: str = "-30d") -> None:
@@ -27,20 +73,48 @@ class JiraService:
 		except Exception:
 			_LOGGER.exception("Failed to initialize Jira client")
 			raise
+		# Reuse pooled keep-alive connections for the raw REST calls below; retries stay with
+		# the JIRA session and _search_jql so they are not stacked at the transport level
+		adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=0)
+		self.client._session.mount("https://", adapter)
+		self.client._session.mount("http://", adapter)
+		self.client._session.headers.update({"Accept": "application/json", "Content-Type": "application/json"})
 
 	def _post_json(self, path: str, body: dict) -> dict:
 		url = f"{self.base_url}{path}"
-		resp = self.client._session.post(url, data=json.dumps(body), headers={"Content-Type": "application/json", "Accept": "application/json"})
+		resp = self.client._session.post(url, data=orjson.dumps(body))
 		if resp.status_code >= 400:
 			raise RuntimeError(f"HTTP {resp.status_code} {resp.reason}: {resp.text}")
-		return resp.json()
+		return orjson.loads(resp.content)
 
 	def _get_json(self, path: str, params: dict | None = None) -> dict:
 		url = f"{self.base_url}{path}"
-		resp = self.client._session.get(url, params=params, headers={"Accept": "application/json"})
+		resp = self.client._session.get(url, params=params)
 		if resp.status_code >= 400:
 			raise RuntimeError(f"HTTP {resp.status_code} {resp.reason}: {resp.text}")
-		return resp.json()
+		return orjson.loads(resp.content)
+
+	def _search_jql(self, jql: str) -> dict:
+		"""
+		POST /rest/api/3/search/jql with one retry; raises the last error when both attempts fail.
+		"""
+		# New API via official client's session: POST /rest/api/3/search/jql
+		body_jql: dict = {
+			"jql": jql,
+			"maxResults": self.max_issues,
+			# Request fields explicitly; API may still return IDs only
+			"fields": _SEARCH_FIELD_NAMES,
+		}
+		for attempt in range(2):
+			try:
+				return self._post_json("/rest/api/3/search/jql", body_jql)
+			except Exception as e:
+				err_body = str(e)
+				_LOGGER.error(f"Jira search/jql failed | attempt={attempt + 1} | jql={jql} | body={err_body}")
+				if attempt == 0:
+					time.sleep(3)
+				else:
+					raise
 
 	def search_related_issues(
 		self,
@@ -51,20 +125,34 @@ class JiraService:
 		search_window: str = "-30d",
 		mr_url: str | None = None,
 	) -> list[dict[str, str]]:
+		# Re-triggered reviews of the same MR ask the same question; answer from memory for a short while
+		cache_key = (
+			self.base_url,
+			tuple(self.project_keys),
+			self.max_issues,
+			title,
+			description,
+			tuple(sorted(labels or [])),
+			created_at_iso,
+			search_window or self.search_window,
+			mr_url,
+		)
+		now = time.monotonic()
+		with _SEARCH_CACHE_LOCK:
+			entry = _SEARCH_CACHE.get(cache_key)
+			if entry is not None and now - entry[0] < _SEARCH_CACHE_TTL_SECONDS:
+				return list(entry[1])
 		def _esc(s: str) -> str:
-			return s.replace("\\", "\\\\").replace('"', '\\"')
+			return s.translate(_JQL_ESCAPE)
 		def _tokens(text: str, min_len: int, limit: int) -> list[str]:
 			if not text:
 				return []
-			import re as _re
-			words = _re.findall(r"[A-Za-z0-9_]+", text.lower())
-			stop = {"the","and","for","with","from","that","this","which","into","over","under","your","their","our","are","was","were","have","has","had","you","him","her","its","they","them","can","could","should","would","about","after","before","into","onto"}
+			words = _TOKEN_RE.findall(text.lower())
 			out: list[str] = []
-			seen = set()
-			for w in words:
-				if len(w) < min_len or w in stop or w in seen:
+			# dict.fromkeys dedupes while keeping first-seen order
+			for w in dict.fromkeys(words):
+				if len(w) < min_len or w in _STOPWORDS:
 					continue
-				seen.add(w)
 				out.append(w)
 				if len(out) >= limit:
 					break
@@ -85,107 +173,97 @@ class JiraService:
 		# Build targeted queries: URL, text tokens, labels
 		queries: list[str] = []
 		base = " AND ".join(_base_clauses())
+		prefix = f"{base} AND " if base else ""
 		if mr_url:
-			queries.append(f'{base + " AND " if base else ""}(description ~ "{_esc(mr_url)}") ORDER BY updated DESC')
+			queries.append(f'{prefix}(description ~ "{_esc(mr_url)}"){_JQL_ORDER}')
 		title_tokens = _tokens(title or "", 3, 6)
 		desc_tokens = _tokens(description or "", 5, 6)
-		text_tokens = title_tokens + [t for t in desc_tokens if t not in set(title_tokens)]
+		text_tokens = list(dict.fromkeys(title_tokens + desc_tokens))
 		if text_tokens:
 			token_or = " OR ".join([f'text ~ "{_esc(t)}"' for t in text_tokens])
-			queries.append(f'{base + " AND " if base else ""}({token_or}) ORDER BY updated DESC')
-		if labels:
-			lbls = ",".join([f'"{_esc(label)}"' for label in labels[:5]])
-			queries.append(f'{base + " AND " if base else ""}(labels in ({lbls})) ORDER BY updated DESC')
+			queries.append(f"{prefix}({token_or}){_JQL_ORDER}")
+		# Labels merged from several sources often repeat; dedupe before capping
+		unique_labels = list(dict.fromkeys(labels))[:5] if labels else []
+		if unique_labels:
+			lbls = ",".join([f'"{_esc(label)}"' for label in unique_labels])
+			queries.append(f"{prefix}(labels in ({lbls})){_JQL_ORDER}")
 		if not queries:
-			queries.append(base + " ORDER BY updated DESC" if base else "ORDER BY updated DESC")
+			queries.append(f"{base}{_JQL_ORDER}" if base else _JQL_ORDER.lstrip())
 		_LOGGER.info("Jira search queries_count=%s maxResults=%s", len(queries), self.max_issues)
 		all_issues: dict[str, dict] = {}
-		for idx, jql in enumerate(queries):
-			ok = False
-			data = {}
-			for attempt in range(2):
+		# Queries are independent round-trips; run them concurrently and merge in priority order
+		with ThreadPoolExecutor(max_workers=min(4, len(queries)), thread_name_prefix="jira-search") as pool:
+			futures = [pool.submit(self._search_jql, jql) for jql in queries]
+			for jql, fut in zip(queries, futures):
 				try:
-					# New API via official client's session: POST /rest/api/3/search/jql
-					body_jql: dict = {
-						"jql": jql,
-						"maxResults": self.max_issues,
-						# Request fields explicitly; API may still return IDs only
-						"fields": ["summary", "status", "updated"],
-					}
-					data = self._post_json("/rest/api/3/search/jql", body_jql)
+					data = fut.result()
 					ok = True
-					break
-				except Exception as e:
-					err_body = str(e)
-					_LOGGER.error(f"Jira search/jql failed | attempt={attempt + 1} | jql={jql} | body={err_body}")
-					if attempt == 0:
-						time.sleep(3)
-			if not ok:
-				# fallback issue picker per query token set
-				try:
-					qtoken = jql.split('"')
-					token = qtoken[1] if len(qtoken) > 1 else ""
-					pk = self._get_json("/rest/api/3/issue/picker", params={"query": token})
-					for it in (pk.get("issues") or []):
-						key = it.get("key", "")
-						if key and key not in all_issues:
-							all_issues[key] = {"key": key, "fields": {"summary": it.get("summary", ""), "status": {"name": ""}, "updated": ""}}
-					_LOGGER.info("Jira fallback issue picker used", extra={"token": token})
 				except Exception:
-					continue
-			else:
-				# Normalize and accumulate
-				raw_issues = []
-				if isinstance(data, dict):
-					raw_issues = data.get("issues") or []
-				# If fields are missing, bulk fetch minimal fields
-				need_bulk = False
-				for it in raw_issues:
-					f = it.get("fields")
-					if not isinstance(f, dict) or ("summary" not in f and "status" not in f and "updated" not in f):
-						need_bulk = True
-						break
-				if need_bulk and raw_issues:
+					data = {}
+					ok = False
+				if not ok:
+					# fallback issue picker per query token set
 					try:
-						ids_or_keys = []
-						for it in raw_issues:
-							key = it.get("key") or it.get("id")
-							if key:
-								ids_or_keys.append(key)
-						bulk_body = {"issueIdsOrKeys": ids_or_keys, "fields": ["summary", "status", "updated"]}
-						bulk = self._post_json("/rest/api/3/issue/bulkfetch", bulk_body)
-						if isinstance(bulk, dict):
-							# Bulk may return issues list or map; normalize to list
-							bulk_items = []
-							if "issues" in bulk and isinstance(bulk.get("issues"), list):
-								bulk_items = bulk.get("issues") or []
-							elif "results" in bulk and isinstance(bulk.get("results"), list):
-								bulk_items = bulk.get("results") or []
-							by_key: dict[str, dict] = {}
-							for bi in bulk_items:
-								k = bi.get("key") or bi.get("id")
-								if k:
-									by_key[k] = bi
-							# merge fields back
-							for it in raw_issues:
-								k = it.get("key") or it.get("id")
-								if k and k in by_key:
-									if "fields" not in it or not isinstance(it.get("fields"), dict):
-										it["fields"] = {}
-									it["fields"].update(by_key[k].get("fields") or {})
+						qtoken = jql.split('"')
+						token = qtoken[1] if len(qtoken) > 1 else ""
+						pk = self._get_json("/rest/api/3/issue/picker", params={"query": token})
+						for it in (pk.get("issues") or []):
+							key = it.get("key", "")
+							if key and key not in all_issues:
+								all_issues[key] = {"key": key, "fields": {"summary": it.get("summary", ""), "status": {"name": ""}, "updated": ""}}
+						_LOGGER.info("Jira fallback issue picker used", extra={"token": token})
 					except Exception:
-						_LOGGER.exception("Jira bulkfetch failed; proceeding with available fields")
-				keys = []
-				for it in raw_issues:
-					key = it.get("key") or it.get("id")
-					if key and key not in all_issues:
-						all_issues[key] = it
-						keys.append(key)
-				_LOGGER.info("Jira query matched", extra={"jql": jql, "count": len(keys), "keys": keys[:5]})
-			# Stop early if we have enough
-			if len(all_issues) >= self.max_issues:
-				break
-		raw_list = list(all_issues.values())[: self.max_issues]
+						continue
+				else:
+					# Normalize and accumulate
+					raw_issues = []
+					if isinstance(data, dict):
+						raw_issues = data.get("issues") or []
+					# If fields are missing, bulk fetch minimal fields
+					need_bulk = any(
+						not isinstance(it.get("fields"), dict) or not (_SEARCH_FIELDS & it["fields"].keys())
+						for it in raw_issues
+					)
+					if need_bulk and raw_issues:
+						try:
+							ids_or_keys = []
+							for it in raw_issues:
+								key = it.get("key") or it.get("id")
+								if key:
+									ids_or_keys.append(key)
+							bulk_body = {"issueIdsOrKeys": ids_or_keys, "fields": _SEARCH_FIELD_NAMES}
+							bulk = self._post_json("/rest/api/3/issue/bulkfetch", bulk_body)
+							if isinstance(bulk, dict):
+								# Bulk may return issues list or map; normalize to list
+								bulk_items = []
+								if "issues" in bulk and isinstance(bulk.get("issues"), list):
+									bulk_items = bulk.get("issues") or []
+								elif "results" in bulk and isinstance(bulk.get("results"), list):
+									bulk_items = bulk.get("results") or []
+								by_key: dict[str, dict] = {}
+								for bi in bulk_items:
+									k = bi.get("key") or bi.get("id")
+									if k:
+										by_key[k] = bi
+								# merge fields back
+								for it in raw_issues:
+									k = it.get("key") or it.get("id")
+									if k and k in by_key:
+										if "fields" not in it or not isinstance(it.get("fields"), dict):
+											it["fields"] = {}
+										it["fields"].update(by_key[k].get("fields") or {})
+						except Exception:
+							_LOGGER.exception("Jira bulkfetch failed; proceeding with available fields")
+					new = {k: it for it in raw_issues if (k := it.get("key") or it.get("id")) and k not in all_issues}
+					all_issues.update(new)
+					keys = list(new)
+					_LOGGER.info("Jira query matched", extra={"jql": jql, "count": len(keys), "keys": keys[:5]})
+				# Stop early if we have enough
+				if len(all_issues) >= self.max_issues:
+					for pending in futures:
+						pending.cancel()
+					break
+		raw_list = list(itertools.islice(all_issues.values(), self.max_issues))
 		issues_out: list[dict[str, str]] = []
 		for it in raw_list:
 			key = it.get("key")
@@ -206,7 +284,11 @@ class JiraService:
 			"Jira search final",
 			extra={"matched": len(issues_out), "keys": [i.get("key") for i in issues_out]},
 		)
-		return issues_out
+		with _SEARCH_CACHE_LOCK:
+			_SEARCH_CACHE[cache_key] = (now, issues_out)
+			while len(_SEARCH_CACHE) > _SEARCH_CACHE_MAXSIZE:
+				_SEARCH_CACHE.pop(next(iter(_SEARCH_CACHE)))
+		return list(issues_out)
 	
 	def add_remote_link(self, issue_key: str, url: str, title: str | None = None) -> None:
 		"""
@@ -228,25 +310,7 @@ class JiraService:
 		labels: list[str] | None = None,
 		issue_type: str = "Task",
 	) -> dict[str, str] | None:
-		def _to_adf(text: str) -> dict:
-			paras = [p for p in (text or "").split("\n\n") if p.strip()]
-			content = []
-			for p in paras:
-				# Preserve newlines within paragraph as hardBreaks
-				segments = p.split("\n")
-				inner = []
-				for idx, seg in enumerate(segments):
-					if seg:
-						inner.append({"type": "text", "text": seg})
-					if idx < len(segments) - 1:
-						inner.append({"type": "hardBreak"})
-				if not inner:
-					inner = [{"type": "text", "text": ""}]
-				content.append({"type": "paragraph", "content": inner})
-			if not content:
-				content = [{"type": "paragraph", "content": [{"type": "text", "text": ""}]}]
-			return {"type": "doc", "version": 1, "content": content}
-		desc_adf = _to_adf(description)
+		desc_adf = _to_adf(description or "")
 		_LOGGER.debug(
 			"Jira create_issue request",
 			extra={
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Any
 
 from fastapi import APIRouter, Depends, Request
@@ -19,7 +20,11 @@ async def list_repositories(
 	items = repos_service.load_repos(user_id)
 	if search:
 		q = search.lower()
-		items = [r for r in items if q in (r.get("name") or "").lower() or q in (r.get("full_path") or "").lower()]
+		items = [
+			r for r in items
+			if q in (r.get("name_lc") or (r.get("name") or "").lower())
+			or q in (r.get("full_path_lc") or (r.get("full_path") or "").lower())
+		]
 	total = len(items)
 	start = max(0, (page - 1) * per_page)
 	end = start + per_page
@@ -29,7 +34,8 @@ async def list_repositories(
 @router.post("/repositories/sync")
 async def sync_repositories_route(request: Request, current_user: dict[str, Any] = Depends(get_current_user)) -> dict[str, Any]:
 	user_id = current_user["user_id"]
-	count = repos_service.sync_repositories(user_id)
+	# GitLab crawls and store writes block; keep them off the event loop
+	count = await asyncio.to_thread(repos_service.sync_repositories, user_id)
 	return {"synced": count}
 
 
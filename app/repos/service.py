@@ -1,70 +1,90 @@
 import os
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import gitlab
 from fastapi import HTTPException
 from gitlab.exceptions import GitlabError
 
-from ..storage.json_store import load_json, save_json
+from ..storage import cached_store
 
 GITLAB_URL = os.environ.get("GITLAB_URL", "https://gitlab.com")
 _LOGGER = logging.getLogger(__name__)
 
 
 def load_repos(user_id: str) -> list[dict[str, Any]]:
-	all_repos: dict[str, list[dict[str, Any]]] = load_json("repos.json", {})
-	return all_repos.get(user_id) or []
+	"""
+	Return the user's stored repositories. The items are shared with the document cache and are read-only;
+	change them through `save_repos`.
+	"""
+	all_repos: dict[str, list[dict[str, Any]]] = cached_store.get_cache("repos.json")
+	return list(all_repos.get(user_id) or [])
 
 
 def save_repos(user_id: str, items: list[dict[str, Any]]) -> None:
-	all_repos: dict[str, list[dict[str, Any]]] = load_json("repos.json", {})
-	all_repos[user_id] = items
-	save_json("repos.json", all_repos)
+	def _replace(all_repos: dict[str, list[dict[str, Any]]]) -> None:
+		all_repos[user_id] = items
+
+	cached_store.update("repos.json", _replace)
+
+
+def _fetch_token_projects(user_id: str, t: dict[str, Any]) -> list[dict[str, Any]]:
+	"""
+	List the GitLab projects visible to one stored token. Revoked tokens (401) yield no projects.
+	"""
+	items: list[dict[str, Any]] = []
+	try:
+		gl = gitlab.Gitlab(GITLAB_URL, private_token=t["token"])
+		gl.auth()
+		# Stream pages instead of buffering the whole membership list up front
+		projs = gl.projects.list(membership=True, iterator=True, per_page=100)
+		for p in projs:
+			try:
+				pid = int(getattr(p, "id", 0) or 0)
+				if not pid:
+					continue
+				name = getattr(p, "name", None)
+				full_path = getattr(p, "path_with_namespace", None)
+				items.append({
+					"id": f"repo_{pid}",
+					"gitlab_repo_id": pid,
+					"name": name,
+					"full_path": full_path,
+					# Lowercased copies so /repositories search needs no per-request lower()
+					"name_lc": (name or "").lower(),
+					"full_path_lc": (full_path or "").lower(),
+					"visibility": getattr(p, "visibility", None),
+					"description": getattr(p, "description", None),
+					"last_review_at": None,
+				})
+			except Exception as e:
+				_LOGGER.warning(f"Failed to process project {getattr(p, 'id', 'N/A')}: {e}")
+				continue
+	except GitlabError as e:
+		_LOGGER.warning(f"GitLab API error for user {user_id} with token ID {t.get('id')}: {e}")
+		if e.response_code == 401:
+			return []
+		raise HTTPException(status_code=502, detail=f"GitLab API error: {e.error_message}")
+	except Exception as e:
+		_LOGGER.error(f"Unexpected error during GitLab sync for user {user_id}: {e}", exc_info=True)
+		raise HTTPException(status_code=500, detail="An internal error occurred during repository sync.")
+	return items
 
 
 def sync_repositories(user_id: str) -> int:
-	tokens: dict[str, list[dict[str, Any]]] = load_json("tokens.json", {})
-	user_tokens = tokens.get(user_id) or []
+	tokens: dict[str, list[dict[str, Any]]] = cached_store.get_cache("tokens.json")
+	user_tokens = [t for t in (tokens.get(user_id) or []) if t.get("token")]
 	if not user_tokens:
 		save_repos(user_id, [])
 		return 0
 	projects_map: dict[int, dict[str, Any]] = {}
-	for t in user_tokens:
-		private_token = t.get("token")
-		if not private_token:
-			continue
-		try:
-			gl = gitlab.Gitlab(GITLAB_URL, private_token=private_token)
-			gl.auth()
-			projs = gl.projects.list(membership=True, all=True)
-			for p in projs:
-				try:
-					pid = int(getattr(p, "id", 0) or 0)
-					if not pid:
-						continue
-					projects_map[pid] = {
-						"id": f"repo_{pid}",
-						"gitlab_repo_id": pid,
-						"name": getattr(p, "name", None),
-						"full_path": getattr(p, "path_with_namespace", None),
-						"visibility": getattr(p, "visibility", None),
-						"description": getattr(p, "description", None),
-						"last_review_at": None,
-					}
-				except Exception as e:
-					_LOGGER.warning(f"Failed to process project {getattr(p, 'id', 'N/A')}: {e}")
-					continue
-		except GitlabError as e:
-			_LOGGER.warning(f"GitLab API error for user {user_id} with token ID {t.get('id')}: {e}")
-			if e.response_code == 401:
-				continue
-			raise HTTPException(status_code=502, detail=f"GitLab API error: {e.error_message}")
-		except Exception as e:
-			_LOGGER.error(f"Unexpected error during GitLab sync for user {user_id}: {e}", exc_info=True)
-			raise HTTPException(status_code=500, detail="An internal error occurred during repository sync.")
-	repos = list(projects_map.values())
+	# Each token is an independent paginated crawl; fetch them side by side, merge in token order
+	with ThreadPoolExecutor(max_workers=min(len(user_tokens), 8)) as ex:
+		for items in ex.map(lambda t: _fetch_token_projects(user_id, t), user_tokens):
+			for item in items:
+				projects_map[item["gitlab_repo_id"]] = item
+	# Stored pre-sorted so paginated reads are a plain slice
+	repos = sorted(projects_map.values(), key=lambda r: r["full_path_lc"])
 	save_repos(user_id, repos)
 	return len(repos)
-
-
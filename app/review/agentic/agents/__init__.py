@@ -1,17 +1,25 @@
-from .code_agent import CodeSummaryAgent
-from .diagram_agent import DiagramAgent
-from .naming_agent import NamingQualityAgent
-from .task_agent import TaskContextAgent
-from .test_agent import TestCoverageAgent
-from .discussion_agent import DiscussionAgent
+import importlib
 
-__all__ = [
-	"TaskContextAgent",
-	"CodeSummaryAgent",
-	"NamingQualityAgent",
-	"TestCoverageAgent",
-	"DiagramAgent",
-	"DiscussionAgent",
-]
+# Agents are resolved on first attribute access so importing the package stays cheap
+_LAZY = {
+	"BaseAgent": "base",
+	"TaskContextAgent": "task_agent",
+	"CodeSummaryAgent": "code_agent",
+	"NamingQualityAgent": "naming_agent",
+	"TestCoverageAgent": "test_agent",
+	"DiagramAgent": "diagram_agent",
+	"DiscussionAgent": "discussion_agent",
+}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name: str):
+	module = _LAZY.get(name)
+	if module is None:
+		raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+	value = getattr(importlib.import_module(f".{module}", __name__), name)
+	globals()[name] = value
+	return value
 
 
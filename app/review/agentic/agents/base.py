@@ -1,13 +1,61 @@
 from abc import ABC, abstractmethod
 
+import orjson
+
+from ....utils.text import strip_code_fence
 from ..llm import LLMClient
-from ..models import AgentPayload, AgentResult
+from ..models import AgentFinding, AgentPayload, AgentResult
+
+# Input budget for one agent prompt; leaves ample headroom on every supported model's context window
+PROMPT_TOKEN_BUDGET = 32_000
+
+
+def files_token_budget(prefix_tokens: int) -> int:
+	"""
+	Tokens left for file snippets after a static prefix. Rounded down to 4k so agents with similar
+	prefixes request the same budget and share the payload's rendered blob.
+	"""
+	return max(0, PROMPT_TOKEN_BUDGET - prefix_tokens) // 4096 * 4096
+
+
+def _line_number(value: object) -> int:
+	if type(value) is int:
+		return value
+	# JSON numbers like 12.0 are still valid line numbers
+	if isinstance(value, float) and value.is_integer():
+		return int(value)
+	if isinstance(value, str) and value.isdigit():
+		return int(value)
+	return 0
+
+
+def parse_findings(items: object, source: str) -> list[AgentFinding]:
+	"""
+	Validate the `findings` array shared by the JSON agents ({path, line, comment}); invalid items are skipped.
+	This is the only check between model output and AgentFinding, so agents use the results as-is.
+	"""
+	if not isinstance(items, list):
+		return []
+	return [
+		AgentFinding(path=path, line=line, body=body, source=source)
+		for item in items
+		if isinstance(item, dict)
+		and isinstance(path := item.get("path"), str) and path
+		and isinstance(comment := item.get("comment"), str) and (body := comment.strip())
+		and (line := _line_number(item.get("line"))) > 0
+	]
 
 
 class BaseAgent(ABC):
-	def __init__(self, key: str, title: str) -> None:
-		self.key = key
-		self.title = title
+	# Concrete agents declare these on the class; passing them to __init__ overrides per instance
+	key: str = ""
+	title: str = ""
+
+	def __init__(self, key: str | None = None, title: str | None = None) -> None:
+		if key is not None:
+			self.key = key
+		if title is not None:
+			self.title = title
 
 	@abstractmethod
 	def build_prompt(self, payload: AgentPayload) -> str: ...
@@ -28,4 +76,23 @@ class BaseAgent(ABC):
 		return AgentResult(key=self.key, success=False, error=str(error))
 
 
+class JsonOutputMixin:
+	"""
+	Decoding shared by agents whose model output is a (possibly fenced) JSON object.
+	"""
+
+	def _strip_code_fence(self, text: str) -> str:
+		return strip_code_fence(text)
+
+	def _load_json(self, text: str) -> dict | None:
+		try:
+			data = orjson.loads(self._strip_code_fence(text))
+		except Exception:
+			return None
+		return data if isinstance(data, dict) else None
 
+	@staticmethod
+	def _string_items(value: object) -> list[str]:
+		if not isinstance(value, list):
+			return []
+		return [strip for item in value if isinstance(item, str) and (strip := item.strip())]
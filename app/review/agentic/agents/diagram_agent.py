@@ -1,24 +1,29 @@
 from ..models import AgentPayload
 from .base import BaseAgent
 
+# Fixed instructions lead every prompt so provider-side prefix caching can reuse them across MRs
+_INSTRUCTIONS = (
+    "You are a system designer. Return a SINGLE valid Mermaid code block only.\n"
+    "STRICT:\n"
+    "- Start with ```mermaid and end with ```\n"
+    "- Use either 'graph TD' (preferred) or 'sequenceDiagram'.\n"
+    "- No extra text, no markdown outside the code block.\n"
+    "- Keep nodes concise, show data/flow, highlight changed components.\n"
+    "- Do NOT invent components not implied by files/context.\n"
+    "- If unsure, produce a minimal valid graph TD with 2-4 nodes.\n\n"
+)
+
 
 class DiagramAgent(BaseAgent):
-    def __init__(self) -> None:
-        super().__init__(key="architecture_diagram", title="Architecture Diagram")
+    key = "architecture_diagram"
+    title = "Architecture Diagram"
 
     def build_prompt(self, payload: AgentPayload) -> str:
         files_blob = payload.files_blob(max_files=12, max_chars_per_file=800)
         arch_notes = "\n".join(payload.project_context.architecture) if payload.project_context.architecture else ""
         desc_notes = payload.project_context.description or ""
         return (
-            "You are a system designer. Return a SINGLE valid Mermaid code block only.\n"
-            "STRICT:\n"
-            "- Start with ```mermaid and end with ```\n"
-            "- Use either 'graph TD' (preferred) or 'sequenceDiagram'.\n"
-            "- No extra text, no markdown outside the code block.\n"
-            "- Keep nodes concise, show data/flow, highlight changed components.\n"
-            "- Do NOT invent components not implied by files/context.\n"
-            "- If unsure, produce a minimal valid graph TD with 2-4 nodes.\n\n"
+            f"{_INSTRUCTIONS}"
             f"Project Description (fallback context):\n{desc_notes}\n\n"
             f"Project Architecture Notes:\n{arch_notes}\n\n"
             f"Changed Files (snippets):\n{files_blob}\n"
@@ -26,9 +31,9 @@ class DiagramAgent(BaseAgent):
 
     def postprocess(self, output: str) -> str:
         text = super().postprocess(output).strip()
-        lower = text.lower()
-        if "```mermaid" in lower:
-            start = text.lower().find("```mermaid")
+        # One case-folded copy serves both the presence check and the offset
+        start = text.lower().find("```mermaid")
+        if start != -1:
             trimmed = text[start:]
             # Ensure closing fence
             if "```" not in trimmed[len("```mermaid"):]:
@@ -1,15 +1,25 @@
 from __future__ import annotations
 
+from ....integrations.gemini_client import get_model
 from .base import BaseAgent
-import google.generativeai as genai
 
 
 class DiscussionAgent(BaseAgent):
+    key = "discussion"
+    title = "Discussion Agent"
+
     def __init__(self, model: str, api_key: str, mention_token: str = "@ai-review") -> None:
-        super().__init__(key="discussion", title="Discussion Agent")
+        super().__init__()
         self.mention_token = mention_token
         self.model = model
         self.api_key = api_key
+        # Resolved on first reply so a missing Gemini SDK or key does not break app startup
+        self._gm = None
+
+    def _model(self):
+        if self._gm is None:
+            self._gm = get_model(self.api_key, self.model)
+        return self._gm
 
     def build_prompt(self, payload: str) -> str:
         """
@@ -33,14 +43,12 @@ class DiscussionAgent(BaseAgent):
         dev = (developer_reply or "").strip()
         description_parts: list[str] = []
         if orig:
-            description_parts.append("Original review note:\n" + orig[:4000])
+            description_parts.append(f"Original review note:\n{orig[:4000]}")
         if dev:
-            description_parts.append("Developer reply:\n" + dev[:4000])
+            description_parts.append(f"Developer reply:\n{dev[:4000]}")
         if context:
-            description_parts.append("Context:\n" + context.strip()[:6000])
+            description_parts.append(f"Context:\n{context.strip()[:6000]}")
 
         prompt = self.build_prompt("\n".join(description_parts))
-        genai.configure(api_key=self.api_key)
-        model = genai.GenerativeModel(self.model)
-        resp = model.generate_content(prompt)
+        resp = self._model().generate_content(prompt)
         return (getattr(resp, "text", None) or "").strip()
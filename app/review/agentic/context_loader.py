@@ -1,17 +1,28 @@
-import json
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from .models import ProjectContext
 
 
 def load_project_context(path: str) -> ProjectContext:
-	context_path = Path(path)
-	if not context_path.exists():
+	"""
+	Parsed project context, re-read only when the file's mtime or size changes. Treat the result as read-only.
+	"""
+	try:
+		stat = os.stat(path)
+	except OSError:
 		return ProjectContext()
+	return _load_cached(path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=8)
+def _load_cached(path: str, mtime_ns: int, size: int) -> ProjectContext:
 	try:
-		raw = context_path.read_text(encoding="utf-8")
-		data: dict[str, Any] = json.loads(raw)
+		data: dict[str, Any] = orjson.loads(Path(path).read_bytes())
 	except Exception:
 		return ProjectContext()
 	return ProjectContext(
@@ -22,6 +33,3 @@ def load_project_context(path: str) -> ProjectContext:
 		testing_standards=data.get("testing_standards", ""),
 		coding_guidelines=data.get("coding_guidelines", ""),
 	)
-
-
-
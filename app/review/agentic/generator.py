@@ -1,8 +1,12 @@
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import cache
+from operator import attrgetter
 
+from ...config.config import DEFAULT_AGENTIC_CACHE_TTL
 from ...config.logging_config import configure_logging
 from ..base import InlineFinding, ReviewComment, ReviewGenerator, ReviewOutput
 from .agents import (
+    BaseAgent,
     CodeSummaryAgent,
     DiagramAgent,
     NamingQualityAgent,
@@ -12,9 +16,25 @@ from .agents import (
 from .context_loader import load_project_context
 from .llm import build_llm_client
 from .models import AgentFinding, AgentPayload, AgentResult
+from .result_cache import AgentResultCache
 
 _LOGGER = configure_logging()
 
+# Inline findings are posted grouped by file, top to bottom
+_FINDING_ORDER = attrgetter("path", "line")
+
+
+@cache
+def _default_agents() -> tuple[BaseAgent, ...]:
+	# Review agents hold only their prompt templates, so one set serves every generator
+	return (
+		TaskContextAgent(),
+		CodeSummaryAgent(),
+		DiagramAgent(),
+		NamingQualityAgent(),
+		TestCoverageAgent(),
+	)
+
 
 class AgenticReviewGenerator(ReviewGenerator):
 	def __init__(
@@ -27,18 +47,15 @@ class AgenticReviewGenerator(ReviewGenerator):
 		timeout: float = 60.0,
 		max_retries: int = 2,
 		max_concurrency: int = 4,
+		result_cache_ttl: float = DEFAULT_AGENTIC_CACHE_TTL,
 	) -> None:
 		self.project_context_path = project_context_path
 		self.max_retries = max(0, max_retries)
-		self.client = build_llm_client(provider, model, openai_api_key, google_api_key, timeout)
 		self.max_concurrency = max(1, int(max_concurrency))
-		self.agents = [
-			TaskContextAgent(),
-			CodeSummaryAgent(),
-			DiagramAgent(),
-			NamingQualityAgent(),
-			TestCoverageAgent(),
-		]
+		self.client = build_llm_client(provider, model, openai_api_key, google_api_key, timeout)
+		# Per generator, so results never cross models; a TTL of 0 disables it
+		self.result_cache = AgentResultCache(ttl_seconds=result_cache_ttl)
+		self.agents = list(_default_agents())
 
 	def generate_review(
 		self,
@@ -62,36 +79,93 @@ class AgenticReviewGenerator(ReviewGenerator):
 		if not self.agents:
 			return ReviewOutput(comments=[], inline_findings=[])
 
-		max_workers = min(self.max_concurrency, len(self.agents))
-		with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="agent-worker") as pool:
-			future_to_key = {pool.submit(self._run_agent, agent, payload): agent.key for agent in self.agents}
-			for fut in as_completed(future_to_key):
-				key = future_to_key[fut]
-				try:
-					res = fut.result()
-				except Exception as exc:
-					_LOGGER.warning("Agent future failed", extra={"agent": key, "error": str(exc)})
-					res = AgentResult(key=key, success=False, error=str(exc))
-				results[key] = res
-				if getattr(res, "findings", None):
-					inline_findings.extend(res.findings)
+		# Prompt-building agents share one batched LLM dispatch; anything else runs on the pool
+		batched = [agent for agent in self.agents if isinstance(agent, BaseAgent)] if self.client.available else []
+		pooled = [agent for agent in self.agents if agent not in batched]
+		if not pooled:
+			# The batch already runs concurrently inside the client; no worker threads needed
+			results.update(self._run_batched(batched, payload))
+		else:
+			with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(pooled)), thread_name_prefix="agent-worker") as pool:
+				future_to_key = {pool.submit(self._run_agent, agent, payload): agent.key for agent in pooled}
+				if batched:
+					results.update(self._run_batched(batched, payload))
+				for fut in as_completed(future_to_key):
+					key = future_to_key[fut]
+					try:
+						res = fut.result()
+					except Exception as exc:
+						_LOGGER.warning("Agent future failed", extra={"agent": key, "error": str(exc)})
+						res = AgentResult(key=key, success=False, error=str(exc))
+					results[key] = res
+		for res in results.values():
+			if res.findings:
+				inline_findings.extend(res.findings)
 
 		if inline_findings:
-			inline_findings.sort(key=lambda f: (getattr(f, "path", "") or "", getattr(f, "line", 0)))
+			inline_findings.sort(key=_FINDING_ORDER)
 		comments = self._compose_comments(payload, results)
 		return ReviewOutput(
 			comments=comments,
 			inline_findings=[
-				InlineFinding(path=f.path, line=f.line, body=f.body, source=f.source or "")
+				InlineFinding(path=f.path, line=f.line, body=f.body, source=f.source)
 				for f in inline_findings
 			],
 		)
 
-	def _run_agent(self, agent, payload: AgentPayload) -> AgentResult:
+	def _run_batched(self, agents: list[BaseAgent], payload: AgentPayload) -> dict[str, AgentResult]:
+		results: dict[str, AgentResult] = {}
+		ready: list[tuple[BaseAgent, str]] = []
+		for agent in agents:
+			try:
+				prompt = agent.build_prompt(payload)
+			except Exception as exc:
+				_LOGGER.warning("Agent prompt failed", extra={"agent": agent.key, "error": str(exc)})
+				results[agent.key] = agent.failure(exc)
+				continue
+			# Byte-identical prompt means an unchanged MR; reuse the earlier answer
+			cached = self.result_cache.get(agent.key, prompt)
+			if cached is not None:
+				results[agent.key] = cached
+			else:
+				ready.append((agent, prompt))
+		pending = dict(enumerate(ready))
+		# Parse each agent's answer as soon as it lands instead of waiting for the slowest one
+		try:
+			for idx, raw in self.client.generate_as_completed([prompt for _, prompt in ready], max_concurrency=self.max_concurrency):
+				agent, prompt = pending.pop(idx)
+				results[agent.key] = self._finish_batched(agent, prompt, payload, raw)
+		except Exception as exc:
+			_LOGGER.warning("Agent batch failed", extra={"error": str(exc)})
+			for agent, prompt in pending.values():
+				results[agent.key] = self._finish_batched(agent, prompt, payload, exc)
+			pending.clear()
+		for agent, prompt in pending.values():
+			results[agent.key] = self._finish_batched(agent, prompt, payload, RuntimeError("LLM returned no response"))
+		return results
+
+	def _finish_batched(self, agent: BaseAgent, prompt: str, payload: AgentPayload, raw: str | Exception) -> AgentResult:
+		if not isinstance(raw, Exception):
+			try:
+				result = agent.parse_output(raw)
+			except Exception as exc:
+				raw = exc
+			else:
+				self.result_cache.put(agent.key, prompt, result)
+				return result
+		_LOGGER.warning("Agent execution failed", extra={"agent": agent.key, "error": str(raw)})
+		# The batch counted as the first attempt; retry the rest individually
+		if self.max_retries:
+			result = self._run_agent(agent, payload, attempts=self.max_retries)
+			self.result_cache.put(agent.key, prompt, result)
+			return result
+		return agent.failure(raw)
+
+	def _run_agent(self, agent, payload: AgentPayload, attempts: int | None = None) -> AgentResult:
 		if not self.client.available:
 			return AgentResult(key=agent.key, success=False, error=self.client.unavailable_reason or "LLM unavailable")
 		last_error = None
-		for _ in range(self.max_retries + 1):
+		for _ in range(self.max_retries + 1 if attempts is None else attempts):
 			try:
 				return agent.execute(self.client, payload)
 			except Exception as exc:
@@ -131,18 +205,13 @@ class AgenticReviewGenerator(ReviewGenerator):
 		return ReviewComment(title="Task and Diff Summary", body=body)
 
 	def _collect_bullets(self, *results: AgentResult | None) -> list[str]:
-		bullets: list[str] = []
-		for result in results:
-			if not result or not result.content:
-				continue
-			for line in result.content.splitlines():
-				strip = line.strip()
-				if not strip:
-					continue
-				if strip.startswith("-"):
-					strip = strip[1:].strip()
-				bullets.append(strip)
-		return [b for b in bullets if b]
+		return [
+			bullet
+			for result in results
+			if result and result.content
+			for line in result.content.splitlines()
+			if (bullet := line.strip().removeprefix("-").strip())
+		]
 
 	def _build_diagram_comment(self, results: dict[str, AgentResult]) -> ReviewComment | None:
 		item = results.get("architecture_diagram")
@@ -180,7 +249,11 @@ class AgenticReviewGenerator(ReviewGenerator):
 		return f"**{label}**\nAgent error: {error}"
 
 	def _fallback_body(self, payload: AgentPayload, results: dict[str, AgentResult]) -> str:
-		reason = next((r.error for r in results.values() if r.error), "agent pipeline unavailable")
+		reason = "agent pipeline unavailable"
+		for result in results.values():
+			if result.error:
+				reason = result.error
+				break
 		diff_preview = (payload.diff_text or "")[:2000]
 		return (
 			f"Agentic pipeline unavailable: {reason}\n\n"
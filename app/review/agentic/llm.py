@@ -1,5 +1,9 @@
+import threading
+from collections.abc import Iterator
 from typing import Any
 
+import httpx
+
 from ...config.logging_config import configure_logging
 
 _LOGGER = configure_logging()
@@ -28,6 +32,34 @@ except Exception:  # pragma: no cover
 	ChatGoogleGenerativeAI = None  # type: ignore
 
 
+# Fail fast when every pooled connection is busy instead of queueing for the whole request timeout
+_POOL_TIMEOUT_SECONDS = 10.0
+# Independent of per-batch concurrency: several reviews can run their agent batches at once
+_POOL_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+_http_clients: dict[float, httpx.Client] = {}
+_http_clients_lock = threading.Lock()
+
+
+def _shared_http_client(timeout: float) -> httpx.Client:
+	"""
+	Keep-alive pool shared by every OpenAI chat model with the same timeout, so rebuilt clients reuse warm TLS sockets.
+	"""
+	with _http_clients_lock:
+		client = _http_clients.get(timeout)
+		if client is None:
+			client = httpx.Client(timeout=httpx.Timeout(timeout, pool=_POOL_TIMEOUT_SECONDS), limits=_POOL_LIMITS)
+			_http_clients[timeout] = client
+		return client
+
+
+def close_http_clients() -> None:
+	"""Close every shared pool; called from the app lifespan on shutdown."""
+	with _http_clients_lock:
+		for client in _http_clients.values():
+			client.close()
+		_http_clients.clear()
+
+
 class LLMFactory:
 	def __init__(
 		self,
@@ -49,7 +81,8 @@ class LLMFactory:
 				raise RuntimeError("langchain-openai is not installed")
 			if not self.openai_api_key:
 				raise RuntimeError("OPENAI_API_KEY is required for agentic mode")
-			return ChatOpenAI(model=self.model, api_key=self.openai_api_key, temperature=0, timeout=self.timeout)
+			http_client = _shared_http_client(self.timeout)
+			return ChatOpenAI(model=self.model, api_key=self.openai_api_key, temperature=0, timeout=self.timeout, http_client=http_client)
 		if self.provider in {"google", "gemini"}:
 			if ChatGoogleGenerativeAI is None:
 				raise RuntimeError("langchain-google-genai is not installed")
@@ -73,8 +106,51 @@ class LLMClient:
 			raise RuntimeError(self.unavailable_reason or "LLM backend is not configured")
 		message = HumanMessage(content=prompt)
 		response = self.model.invoke([message])
+		self._log_usage(response)
 		return self._extract_text(response)
 
+	def generate_as_completed(self, prompts: list[str], max_concurrency: int = 4) -> Iterator[tuple[int, str | Exception]]:
+		"""
+		Send several independent prompts in one dispatch, yielding (index, text or exception) as each response lands.
+		"""
+		if not self.model:
+			raise RuntimeError(self.unavailable_reason or "LLM backend is not configured")
+		if not prompts:
+			return
+		inputs = [[HumanMessage(content=prompt)] for prompt in prompts]
+		config = {"max_concurrency": max(1, max_concurrency)}
+		as_completed = getattr(self.model, "batch_as_completed", None)
+		if as_completed is not None:
+			responses = as_completed(inputs, config=config, return_exceptions=True)
+		elif getattr(self.model, "batch", None) is not None:
+			responses = enumerate(self.model.batch(inputs, config=config, return_exceptions=True))
+		else:
+			responses = enumerate(self._invoke_each(inputs))
+		for idx, resp in responses:
+			if isinstance(resp, Exception):
+				yield idx, resp
+				continue
+			self._log_usage(resp)
+			yield idx, self._extract_text(resp)
+
+	def _invoke_each(self, inputs: list[list[Any]]) -> Iterator[Any]:
+		for messages in inputs:
+			try:
+				yield self.model.invoke(messages)
+			except Exception as exc:
+				yield exc
+
+	def _log_usage(self, response: Any) -> None:
+		# Providers cache repeated prompt prefixes; cache_read shows how much of the input was reused
+		usage = getattr(response, "usage_metadata", None)
+		if not isinstance(usage, dict):
+			return
+		details = usage.get("input_token_details") or {}
+		_LOGGER.debug(
+			"LLM usage",
+			extra={"input_tokens": usage.get("input_tokens"), "cached_tokens": details.get("cache_read", 0)},
+		)
+
 	def _extract_text(self, response: Any) -> str:
 		if isinstance(response, str):
 			return response
@@ -99,7 +175,13 @@ class LLMClient:
 		return str(response)
 
 
-def build_llm_client(provider: str, model: str, openai_api_key: str | None, google_api_key: str | None, timeout: float) -> LLMClient:
+def build_llm_client(
+	provider: str,
+	model: str,
+	openai_api_key: str | None,
+	google_api_key: str | None,
+	timeout: float,
+) -> LLMClient:
 	try:
 		backend = LLMFactory(provider, model, openai_api_key, google_api_key, timeout).build()
 		return LLMClient(backend)
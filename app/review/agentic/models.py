@@ -1,7 +1,30 @@
+from bisect import bisect_right
 from dataclasses import dataclass, field
+from itertools import accumulate
 
+# Provider-agnostic estimate: OpenAI and Gemini tokenizers both average about 4 characters per token on code
+CHARS_PER_TOKEN = 4
 
-@dataclass
+
+def estimate_tokens(text: str) -> int:
+	return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def _head_lines(text: str, limit: int) -> list[str]:
+	"""
+	First `limit` lines of `text`, same as `text.splitlines()[:limit]` but without splitting the rest of a large file.
+	"""
+	cut = -1
+	for _ in range(limit):
+		cut = text.find("\n", cut + 1)
+		if cut == -1:
+			return text.splitlines()[:limit]
+	# Every "\n" ends a line, so the first `limit` lines all lie before the limit-th newline
+	return text[:cut + 1].splitlines()[:limit]
+
+
+# Shared between reviews by the context loader's cache, hence frozen
+@dataclass(slots=True, frozen=True)
 class ProjectContext:
 	name: str = "Default Project"
 	description: str = ""
@@ -11,7 +34,7 @@ class ProjectContext:
 	coding_guidelines: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentPayload:
 	title: str
 	description: str
@@ -19,38 +42,59 @@ class AgentPayload:
 	changed_files: list[tuple[str, str]]
 	commit_messages: list[str]
 	project_context: ProjectContext
+	# Rendered blobs are shared by every agent reviewing this payload
+	_blob_cache: dict[tuple, str] = field(default_factory=dict, init=False, repr=False, compare=False)
 
 	def files_blob(self, max_files: int = 8, max_chars_per_file: int = 1500) -> str:
-		if not self.changed_files:
-			return ""
-		lines: list[str] = []
-		for path, content in self.changed_files[:max_files]:
-			snippet = content[:max_chars_per_file]
-			lines.append(f"File: {path}\n{snippet}")
-		return "\n\n".join(lines)
+		key = ("files", max_files, max_chars_per_file)
+		cached = self._blob_cache.get(key)
+		if cached is not None:
+			return cached
+		blob = "\n\n".join(f"File: {path}\n{content[:max_chars_per_file]}" for path, content in self.changed_files[:max_files])
+		self._blob_cache[key] = blob
+		return blob
 
 	def commits_blob(self, max_commits: int = 10) -> str:
-		if not self.commit_messages:
-			return ""
-		selected = self.commit_messages[:max_commits]
-		return "\n".join(f"- {msg}" for msg in selected)
-
+		key = ("commits", max_commits)
+		cached = self._blob_cache.get(key)
+		if cached is not None:
+			return cached
+		blob = "\n".join(f"- {msg}" for msg in self.commit_messages[:max_commits])
+		self._blob_cache[key] = blob
+		return blob
 
-	def files_with_line_numbers(self, max_files: int = 6, max_lines: int = 400) -> str:
+	def files_with_line_numbers(self, max_files: int = 6, max_lines: int = 400, max_tokens: int | None = None) -> str:
+		"""
+		Numbered file snippets; with `max_tokens`, lines stop once the estimated token budget is spent.
+		"""
+		key = ("numbered", max_files, max_lines, max_tokens)
+		cached = self._blob_cache.get(key)
+		if cached is not None:
+			return cached
 		if not self.changed_files:
 			return ""
+		budget = max_tokens * CHARS_PER_TOKEN if max_tokens is not None else None
 		blocks: list[str] = []
 		for path, content in self.changed_files[:max_files]:
-			lines: list[str] = []
-			for idx, line in enumerate(content.splitlines(), start=1):
-				lines.append(f"{idx:04d}: {line}")
-				if idx >= max_lines:
-					break
-			blocks.append(f"File: {path}\n" + "\n".join(lines))
-		return "\n\n".join(blocks)
+			numbered = [f"{idx:04d}: {line}" for idx, line in enumerate(_head_lines(content, max_lines), start=1)]
+			exhausted = False
+			if budget is not None:
+				# Running cost of each line plus its newline; keep the prefix that still fits
+				costs = list(accumulate(len(line) + 1 for line in numbered))
+				fits = bisect_right(costs, budget)
+				exhausted = fits < len(numbered)
+				budget -= costs[fits - 1] if fits else 0
+				del numbered[fits:]
+			blocks.append("\n".join([f"File: {path}", *numbered]))
+			if exhausted:
+				break
+		blob = "\n\n".join(blocks)
+		self._blob_cache[key] = blob
+		return blob
 
 
-@dataclass
+# Slotted: a large MR yields hundreds of findings that are sorted and copied once each
+@dataclass(slots=True)
 class AgentFinding:
 	path: str
 	line: int
@@ -58,13 +102,10 @@ class AgentFinding:
 	source: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentResult:
 	key: str
 	content: str = ""
 	success: bool = True
 	error: str | None = None
 	findings: list[AgentFinding] = field(default_factory=list)
-
-
-
@@ -0,0 +1,55 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from ...config.config import DEFAULT_AGENTIC_CACHE_TTL
+from .models import AgentResult
+
+
+class AgentResultCache:
+	"""
+	Bounded LRU of parsed agent results keyed by a digest of the exact prompt sent to the model.
+	An unchanged MR re-renders byte-identical prompts, so repeat reviews skip the LLM entirely.
+	"""
+
+	def __init__(self, maxsize: int = 256, ttl_seconds: float = DEFAULT_AGENTIC_CACHE_TTL) -> None:
+		self.maxsize = max(1, maxsize)
+		self.ttl_seconds = ttl_seconds
+		self._entries: OrderedDict[bytes, tuple[AgentResult, float]] = OrderedDict()
+		self._lock = threading.Lock()
+
+	@staticmethod
+	def _key(agent_key: str, prompt: str) -> bytes:
+		h = hashlib.blake2b(digest_size=16)
+		h.update(agent_key.encode("utf-8"))
+		h.update(b"\0")
+		h.update(prompt.encode("utf-8"))
+		return h.digest()
+
+	def get(self, agent_key: str, prompt: str) -> AgentResult | None:
+		key = self._key(agent_key, prompt)
+		with self._lock:
+			entry = self._entries.get(key)
+			if entry is None:
+				return None
+			result, expires = entry
+			if expires <= time.monotonic():
+				del self._entries[key]
+				return None
+			self._entries.move_to_end(key)
+			return result
+
+	def put(self, agent_key: str, prompt: str, result: AgentResult) -> None:
+		if self.ttl_seconds <= 0 or not result.success:
+			return
+		key = self._key(agent_key, prompt)
+		with self._lock:
+			self._entries[key] = (result, time.monotonic() + self.ttl_seconds)
+			self._entries.move_to_end(key)
+			while len(self._entries) > self.maxsize:
+				self._entries.popitem(last=False)
+
+	def clear(self) -> None:
+		with self._lock:
+			self._entries.clear()
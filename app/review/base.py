@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ReviewComment:
 	title: str
 	body: str
@@ -13,7 +13,7 @@ class ReviewComment:
 		return self.body.strip()
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class InlineFinding:
 	path: str
 	line: int
@@ -21,7 +21,7 @@ class InlineFinding:
 	source: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ReviewOutput:
 	comments: list[ReviewComment] = field(default_factory=list)
 	inline_findings: list[InlineFinding] = field(default_factory=list)
@@ -14,6 +14,7 @@ def build_services(cfg: AppConfig) -> WebhookProcessor:
         google_api_key=cfg.google_api_key,
         project_context_path=cfg.project_context_path,
         timeout=cfg.agentic_timeout,
+        result_cache_ttl=cfg.agentic_cache_ttl,
     )
     discussion_agent = DiscussionAgent(api_key=cfg.gemini_api_key, model=cfg.gemini_model)
     classifier = GeminiTagClassifier(api_key=cfg.gemini_api_key, model=cfg.gemini_model, max_labels=cfg.label_max)
@@ -1,5 +1,9 @@
+import asyncio
 import logging
 import os
+from contextlib import asynccontextmanager
+
+import orjson
 
 from fastapi import APIRouter, Depends, FastAPI, Header, Request, BackgroundTasks, HTTPException, status
 from fastapi.middleware.cors import CORSMiddleware
@@ -8,7 +12,9 @@ from pydantic import BaseModel
 
 from ..auth.middleware import get_auth
 from ..auth import router as auth_router
+from ..auth.service import close_http_client, prewarm_jwt_keys
 from .models import StatusResponse
+from ..review.agentic.llm import close_http_clients
 from ..repos import router as repos_router
 from ..tokens import router as tokens_router
 from ..webhook import WebhookProcessor
@@ -21,8 +27,18 @@ def _validate_webhook_headers(processor: WebhookProcessor, x_gitlab_event: str |
     return ["Note Hook", "Merge Request Hook"].__contains__(x_gitlab_event)
 
 
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    # Load the Clerk signing keys in the background so startup is not delayed
+    prewarm = asyncio.create_task(asyncio.to_thread(prewarm_jwt_keys))
+    yield
+    await prewarm
+    close_http_client()
+    close_http_clients()
+
+
 def create_app(processor: WebhookProcessor) -> FastAPI:
-    app = FastAPI()
+    app = FastAPI(lifespan=_lifespan)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=os.environ.get("FRONTEND_URL", "http://localhost:3000"),
@@ -59,7 +75,7 @@ def create_app(processor: WebhookProcessor) -> FastAPI:
                 detail="Invalid webhook event type"
             )
 
-        payload = await request.json()
+        payload = orjson.loads(await request.body())
 
         if "object_attributes" not in payload or "project" not in payload:
             raise HTTPException(
@@ -0,0 +1,40 @@
+import threading
+from typing import Any, Callable
+
+from . import json_store
+
+lock = threading.RLock()
+# name -> (backend version, document); reused only while the backend still reports that version
+_caches: dict[str, tuple[Any, dict[str, Any]]] = {}
+
+
+def get_cache(name: str) -> dict[str, Any]:
+	"""
+	Return a stored JSON document, reusing the in-process copy while its backend version is unchanged.
+	The result is shared and must be treated as read-only; change documents through `update`.
+	"""
+	version = json_store.document_version(name)
+	with lock:
+		cached = _caches.get(name)
+		if version is not None and cached is not None and cached[0] == version:
+			return cached[1]
+	data = json_store.load_json(name, {})
+	if version is not None:
+		with lock:
+			_caches[name] = (version, data)
+	return data
+
+
+def update(name: str, mutate: Callable[[dict[str, Any]], None]) -> None:
+	"""Read the document from the store, apply `mutate` and save it before returning."""
+	with lock:
+		data = json_store.load_json(name, {})
+		mutate(data)
+		json_store.save_json(name, data)
+		_caches.pop(name, None)
+
+
+def clear() -> None:
+	"""Drop all cached documents."""
+	with lock:
+		_caches.clear()
@@ -4,12 +4,12 @@ from .provider import get_kv_store
 
 
 def load_json(name: str, default: Any) -> Any:
-	store = get_kv_store()
-	return store.get_json(name, default)
+	return get_kv_store().get_json(name, default)
 
 
 def save_json(name: str, data: Any) -> None:
-	store = get_kv_store()
-	store.set_json(name, data)
+	get_kv_store().set_json(name, data)
 
 
+def document_version(name: str) -> Any:
+	return get_kv_store().get_version(name)
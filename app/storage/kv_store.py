@@ -1,13 +1,16 @@
-import json
 import os
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from ..config.logging_config import configure_logging
 from .base import KeyValueStore
 from .file_lock import FileLock
 
 _LOGGER = configure_logging()
+# Same on-disk layout as json.dump(indent=2, ensure_ascii=False); int keys become strings as before
+_DUMP_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
 
 
 class FileKeyValueStore(KeyValueStore):
@@ -23,8 +26,8 @@ class FileKeyValueStore(KeyValueStore):
         lock_path = f"{path}.lock"
         with FileLock(lock_path):
             try:
-                with open(path, encoding="utf-8") as f:
-                    return json.load(f)
+                with open(path, "rb") as f:
+                    return orjson.loads(f.read())
             except Exception:
                 return default
 
@@ -33,10 +36,18 @@ class FileKeyValueStore(KeyValueStore):
         lock_path = f"{path}.lock"
         with FileLock(lock_path):
             tmp = f"{path}.tmp"
-            with open(tmp, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, indent=2)
+            with open(tmp, "wb") as f:
+                f.write(orjson.dumps(data, option=_DUMP_OPTIONS))
             os.replace(tmp, path)
 
+    def get_version(self, name: str) -> Any:
+        # Every save replaces the file, so inode + mtime + size changes on each write
+        try:
+            st = os.stat(self._file_path(name))
+        except OSError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
     def get_first_token_by_project(self, project_id: int) -> str:
         return os.environ.get("GITLAB_TOKEN") or ""
 
@@ -70,11 +81,19 @@ class MongoKeyValueStore(KeyValueStore):
 
     def set_json(self, name: str, data: Any) -> None:
         try:
-            self.col.update_one({"_id": name}, {"$set": {"data": json.loads(json.dumps(data))}}, upsert=True)
+            self.col.update_one({"_id": name}, {"$set": {"data": orjson.loads(orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS))}, "$inc": {"version": 1}}, upsert=True)
         except Exception:
             _LOGGER.exception("kv_store set_json (mongo) failed")
             raise
 
+    def get_version(self, name: str) -> Any:
+        # Bumped by every set_json; documents written before the counter existed are never cached
+        try:
+            doc = self.col.find_one({"_id": name}, {"version": 1})
+            return doc.get("version") if doc else None
+        except Exception:
+            _LOGGER.exception("kv_store get_version (mongo) failed")
+            return None
 
     def get_first_token_by_project(self, project_id: int) -> str:
         """
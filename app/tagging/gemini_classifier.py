@@ -1,17 +1,41 @@
-import json
+import hashlib
 import os
 import re
+import threading
+from collections import OrderedDict
+
+import orjson
 
 from ..config.logging_config import configure_logging
+from ..integrations.gemini_client import genai, get_model
+from ..utils.text import strip_code_fence
 from .base import TagClassifier
 
 _LOGGER = configure_logging()
 
-try:
-	import google.generativeai as genai  # type: ignore
-	_HAS_GEMINI = True
-except Exception:
-	_HAS_GEMINI = False
+# Separators for models that answer with a plain label list instead of JSON
+_LABEL_SPLIT_RE = re.compile(r"[,;\n]+")
+
+# Most recent label results, keyed by a digest of the classification input
+_LABEL_CACHE_MAXSIZE = 256
+
+# Labels depend on what changed, not on every byte of it; bound the prompt so prefill stays cheap
+_MAX_DIFF_CHARS = 40_000
+_MAX_FILES = 10
+_MAX_FILE_CHARS = 4_000
+
+_HAS_GEMINI = genai is not None
+
+# Dev-mode heuristic labels in priority order, each with the keywords that trigger it
+_DEV_KEYWORDS: dict[str, tuple[str, ...]] = {
+	"bug": ("fix", "bug", "error", "exception"),
+	"docs": ("doc", "readme", "docs"),
+	"test": ("test", "pytest", "coverage"),
+	"perf": ("perf", "optimiz", "latency"),
+	"security": ("xss", "csrf", "auth", "secure"),
+	"refactor": ("refactor", "cleanup"),
+	"feature": ("feat:", "feature", "add "),
+}
 
 
 class GeminiTagClassifier(TagClassifier):
@@ -19,34 +43,21 @@ class GeminiTagClassifier(TagClassifier):
 		self.api_key = api_key
 		self.model = model
 		self.max_labels = max_labels
+		# Webhook retries and label-only MR updates re-send byte-identical prompts
+		self._label_cache: OrderedDict[bytes, list[str]] = OrderedDict()
+		self._cache_lock = threading.Lock()
 	
 	def _is_dev(self) -> bool:
 		return (os.environ.get("ENV", "prod") or "prod").lower() == "dev"
 	
 	def _dev_classify(self, title: str, description: str, diff_text: str, candidates: list[str]) -> list[str]:
 		text = f"{title}\n{description}\n{diff_text}".lower()
-		score: list[tuple[str, int]] = []
-		def add_if(label: str, *keywords: str) -> None:
-			for kw in keywords:
-				if kw in text:
-					score.append((label, 1))
-					return
-		add_if("bug", "fix", "bug", "error", "exception")
-		add_if("docs", "doc", "readme", "docs")
-		add_if("test", "test", "pytest", "coverage")
-		add_if("perf", "perf", "optimiz", "latency")
-		add_if("security", "xss", "csrf", "auth", "secure")
-		add_if("refactor", "refactor", "cleanup")
-		add_if("feature", "feat:", "feature", "add ")
-		# Deduplicate while preserving order and filtering to candidates
-		chosen: list[str] = []
-		seen = set()
-		for label, _ in score:
-			if label in seen:
-				continue
-			if any(label.lower() == c.lower() for c in candidates):
-				chosen.append(next(c for c in candidates if c.lower() == label.lower()))
-				seen.add(label)
+		hits = {label for label, keywords in _DEV_KEYWORDS.items() if any(kw in text for kw in keywords)}
+		# Keep label priority order, filtered to candidates (first spelling wins)
+		cand_lc: dict[str, str] = {}
+		for c in candidates:
+			cand_lc.setdefault(c.lower(), c)
+		chosen = [cand_lc[label] for label in _DEV_KEYWORDS if label in hits and label in cand_lc]
 		return chosen[: max(1, int(self.max_labels or 1))]
 	
 	def _build_prompt(
@@ -58,15 +69,8 @@ class GeminiTagClassifier(TagClassifier):
 		commit_messages: list[str],
 		candidates: list[str],
 	) -> str:
-		files_blob = ""
-		if changed_files:
-			parts: list[str] = []
-			for path, content in changed_files[:10]:
-				parts.append(f"File: {path}\nContent:\n{content}\n")
-			files_blob = "\n".join(parts)
-		commits_blob = ""
-		if commit_messages:
-			commits_blob = "\n".join(f"- {m}" for m in commit_messages[:20])
+		files_blob = "\n".join(f"File: {path}\nContent:\n{content}\n" for path, content in changed_files[:_MAX_FILES])
+		commits_blob = "\n".join(f"- {m}" for m in commit_messages[:20])
 		choices = ", ".join(candidates)
 		maxn = max(1, int(self.max_labels or 1))
 		return (
@@ -86,19 +90,16 @@ class GeminiTagClassifier(TagClassifier):
 	def _parse_model_response(self, raw: str, candidates: list[str], maxn: int) -> list[str]:
 		if not raw:
 			return []
-		# Strip code fences if present
-		if raw.startswith("```"):
-			raw = re.sub(r"^```[a-zA-Z0-9_-]*\s*", "", raw)
-			raw = re.sub(r"\s*```$", "", raw)
+		raw = strip_code_fence(raw)
 		selected: list[str] = []
 		try:
-			data = json.loads(raw)
+			data = orjson.loads(raw)
 			if isinstance(data, list):
 				for item in data:
 					if isinstance(item, str):
 						selected.append(item.strip())
 		except Exception:
-			for part in re.split(r"[,;\n]+", raw):
+			for part in _LABEL_SPLIT_RE.split(raw):
 				part = part.strip("`'\" \t\r")
 				if part:
 					selected.append(part)
@@ -132,14 +133,59 @@ class GeminiTagClassifier(TagClassifier):
 		if not candidates:
 			return []
 		try:
-			genai.configure(api_key=self.api_key)
-			model = genai.GenerativeModel(self.model)
 			maxn = max(1, int(self.max_labels or 1))
+			diff_text = diff_text[:_MAX_DIFF_CHARS]
+			changed_files = [(path, content[:_MAX_FILE_CHARS]) for path, content in changed_files[:_MAX_FILES]]
+			key = self._cache_key(title, description, diff_text, changed_files, commit_messages, candidates, maxn)
+			cached = self._cached_labels(key)
+			if cached is not None:
+				return cached
 			prompt = self._build_prompt(title, description, diff_text, changed_files, commit_messages, candidates)
+			model = get_model(self.api_key, self.model)
 			resp = model.generate_content(prompt)
 			raw = (getattr(resp, "text", None) or "").strip()
-			return self._parse_model_response(raw, candidates, maxn)
+			labels = self._parse_model_response(raw, candidates, maxn)
+			self._store_labels(key, labels)
+			return labels
 		except Exception:
 			return []
 
+	def _cache_key(
+		self,
+		title: str,
+		description: str,
+		diff_text: str,
+		changed_files: list[tuple[str, str]],
+		commit_messages: list[str],
+		candidates: list[str],
+		maxn: int,
+	) -> bytes:
+		"""
+		Digest of exactly the inputs `_build_prompt` uses, fed piecewise so a hit never renders the prompt.
+		"""
+		h = hashlib.blake2b(digest_size=16)
+		for part in (self.model, str(maxn), str(len(candidates)), *candidates, title, description, diff_text):
+			h.update(f"{part}\0".encode())
+		for path, content in changed_files[:_MAX_FILES]:
+			h.update(f"{path}\0{content}\0".encode())
+		h.update(b"\1")
+		for msg in commit_messages[:20]:
+			h.update(f"{msg}\0".encode())
+		return h.digest()
+
+	def _cached_labels(self, key: bytes) -> list[str] | None:
+		with self._cache_lock:
+			labels = self._label_cache.get(key)
+			if labels is None:
+				return None
+			self._label_cache.move_to_end(key)
+			return list(labels)
+
+	def _store_labels(self, key: bytes, labels: list[str]) -> None:
+		with self._cache_lock:
+			self._label_cache[key] = list(labels)
+			self._label_cache.move_to_end(key)
+			while len(self._label_cache) > _LABEL_CACHE_MAXSIZE:
+				self._label_cache.popitem(last=False)
+
 
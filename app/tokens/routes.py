@@ -1,11 +1,11 @@
 from typing import Any
 
+import orjson
 from fastapi import APIRouter, Depends, HTTPException, Request, Response
 
 from ..config.config import AppConfig
 from ..config.logging_config import configure_logging
 from ..auth.auth import get_current_user
-from ..storage.json_store import load_json, save_json
 from . import service as token_service
 from ..storage.provider import get_kv_store
 from ..vcs.gitlab_service import GitLabService
@@ -13,7 +13,7 @@ from ..vcs.gitlab_service import GitLabService
 _LOGGER = configure_logging()
 router = APIRouter()
 
-cfg = AppConfig()
+cfg = AppConfig.load()
 
 @router.get("/onboarding/status")
 async def onboarding_status(request: Request, current_user: dict[str, Any] = Depends(get_current_user)) -> dict[str, Any]:
@@ -32,7 +32,7 @@ async def add_token(request: Request, current_user: dict[str, Any] = Depends(get
 
     # Parse JSON body with error handling
     try:
-        body = await request.json()
+        body = orjson.loads(await request.body())
     except Exception as e:
         _LOGGER.error(f"Failed to parse JSON body: {e}")
         raise HTTPException(status_code=400, detail="Invalid JSON in request body")
@@ -50,22 +50,12 @@ async def add_token(request: Request, current_user: dict[str, Any] = Depends(get
     if not ok:
         raise HTTPException(status_code=400, detail="Token validation failed with GitLab")
 
-    new_token = token_service.add_user_token(user_id, token, name)
-    new_token["project_id"] = proj_id
+    new_token = token_service.add_user_token(user_id, token, name, project_id=proj_id)
 
     gl_service = GitLabService("", token)
     project = gl_service.get_project(proj_id)
     gl_service.ensure_webhook_for_project(project, cfg.webhook_url, cfg.webhook_secret)
 
-    # To avoid saving the token twice, we can update the project_id in the stored token
-    tokens: dict[str, list[dict[str, Any]]] = load_json("tokens.json", {})
-    user_tokens = tokens.get(user_id, [])
-    for t in user_tokens:
-        if t.get("id") == new_token["id"]:
-            t["project_id"] = proj_id
-            break
-    save_json("tokens.json", tokens)
-
     # For security, don't return the raw token in the response
     token_response = new_token.copy()
     token_response.pop("token", None)
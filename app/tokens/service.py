@@ -1,11 +1,11 @@
 import datetime
 import os
-import uuid
+import secrets
 from typing import Any
 
 import gitlab
 
-from ..storage.json_store import load_json, save_json
+from ..storage import cached_store
 
 GITLAB_URL = os.environ.get("GITLAB_URL", "https://gitlab.com")
 
@@ -26,40 +26,42 @@ def validate_token_with_gitlab(token: str) -> tuple[bool, int | None]:
 		return False, None
 
 
-def add_user_token(user_id: str, token: str, name: str) -> dict[str, Any]:
-	tokens: dict[str, list[dict[str, Any]]] = load_json("tokens.json", {})
-	user_tokens = tokens.get(user_id) or []
-	
+def add_user_token(user_id: str, token: str, name: str, project_id: int | None = None) -> dict[str, Any]:
 	# Use timezone-aware UTC timestamp
 	now_iso = datetime.datetime.now(datetime.timezone.utc).isoformat()
 	
 	new_token = {
-		"id": f"token_{uuid.uuid4().hex[:8]}",
+		"id": f"token_{secrets.token_hex(4)}",
 		"name": name,
-		"project_id": None,
+		"project_id": project_id,
 		"scopes": ["api"],
 		"created_at": now_iso,
 		"last_used_at": None,
 		"token": token,
 	}
 	
-	user_tokens.append(new_token)
-	tokens[user_id] = user_tokens
-	save_json("tokens.json", tokens)
+	def _append(tokens: dict[str, list[dict[str, Any]]]) -> None:
+		tokens.setdefault(user_id, []).append(new_token)
+
+	cached_store.update("tokens.json", _append)
 	
 	return new_token
 
 
 def list_user_tokens(user_id: str) -> list[dict[str, Any]]:
-	tokens: dict[str, list[dict[str, Any]]] = load_json("tokens.json", {})
-	return tokens.get(user_id) or []
+	"""
+	Return the user's stored tokens. The items are shared with the document cache and are read-only;
+	change them through `add_user_token` / `delete_user_token`.
+	"""
+	tokens: dict[str, list[dict[str, Any]]] = cached_store.get_cache("tokens.json")
+	return list(tokens.get(user_id) or [])
 
 
 def delete_user_token(user_id: str, token_id: str) -> None:
-	tokens: dict[str, list[dict[str, Any]]] = load_json("tokens.json", {})
-	user_tokens = tokens.get(user_id) or []
-	new_list = [t for t in user_tokens if t.get("id") != token_id]
-	tokens[user_id] = new_list
-	save_json("tokens.json", tokens)
+	def _remove(tokens: dict[str, list[dict[str, Any]]]) -> None:
+		user_tokens = tokens.get(user_id) or []
+		tokens[user_id] = [t for t in user_tokens if t.get("id") != token_id]
+
+	cached_store.update("tokens.json", _remove)
 
 
@@ -0,0 +1,3 @@
+"""
+Small dependency-free helpers shared across packages.
+"""
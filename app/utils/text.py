@@ -0,0 +1,17 @@
+import string
+
+# Characters of the optional language tag after an opening fence (```json, ```py3, ```objective-c)
+_FENCE_TAG_CHARS = string.ascii_letters + string.digits + "_-"
+
+
+def strip_code_fence(text: str) -> str:
+	"""
+	Drop an opening fence with its optional language tag and the closing fence (if the output wasn't truncated).
+	Anything after the tag on the opening line is kept, e.g. ```json {...}.
+	"""
+	strip = text.strip()
+	if not strip.startswith("```"):
+		return strip
+	body = strip[3:].lstrip(_FENCE_TAG_CHARS).lstrip()
+	end = body.rfind("```")
+	return body[:end if end != -1 else len(body)].strip()
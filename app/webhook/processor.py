@@ -7,11 +7,13 @@ from ..review.base import InlineFinding, ReviewGenerator, ReviewOutput
 from ..storage.provider import get_kv_store
 from ..tagging.base import TagClassifier
 from ..vcs.base import VCSService
-from ..storage.json_store import load_json, save_json
+from ..storage import cached_store
 from ..review.agentic.agents.discussion_agent import DiscussionAgent
 from ..vcs.gitlab_service import GitLabService
 
 _ALLOWED_ACTIONS = {"open"}
+# Only the most recent markers matter for de-duplication; older ones are dropped
+_MAX_MARKERS_PER_MR = 50
 storage = get_kv_store()
 
 
@@ -266,47 +268,38 @@ class WebhookProcessor:
     def _apply_labels(self, service: VCSService, mr_iid: int, project: Any, labels: list[str]) -> None:
         service.update_mr_labels(project, mr_iid, labels)
 
-    def _version_store(self) -> dict[str, list[str]]:
-        return load_json("mr_versions.json", {})
+    # Reads revalidate the cached document against the store's version; writes are saved before returning
+    def _has_marker(self, name: str, project_id: int, mr_iid: int, value: str) -> bool:
+        store: dict[str, list[str]] = cached_store.get_cache(name)
+        return value in store.get(f"{project_id}:{mr_iid}", [])
 
-    def _has_local_version_marker(self, project_id: int, mr_iid: int, version_id: str) -> bool:
-        store = self._version_store()
+    def _add_marker(self, name: str, project_id: int, mr_iid: int, value: str) -> None:
         key = f"{project_id}:{mr_iid}"
-        seen: list[str] = store.get(key, [])
-        return version_id in set(seen)
+
+        def _append(store: dict[str, list[str]]) -> None:
+            seen = store.get(key, [])
+            if value not in seen:
+                store[key] = [*seen, value][-_MAX_MARKERS_PER_MR:]
+
+        cached_store.update(name, _append)
+
+    def _has_local_version_marker(self, project_id: int, mr_iid: int, version_id: str) -> bool:
+        return self._has_marker("mr_versions.json", project_id, mr_iid, version_id)
 
     def _mark_local_version_processed(self, project_id: int, mr_iid: int, version_id: str) -> None:
         if not version_id:
             return
-        store = self._version_store()
-        key = f"{project_id}:{mr_iid}"
-        seen: list[str] = store.get(key, [])
-        if version_id not in seen:
-            seen.append(version_id)
-            store[key] = seen
-            save_json("mr_versions.json", store)
-
-    def _commit_store(self) -> dict[str, list[str]]:
-        return load_json("mr_commits.json", {})
+        self._add_marker("mr_versions.json", project_id, mr_iid, version_id)
 
     def _has_local_commit_marker(self, project_id: int, mr_iid: int, commit_sha: str) -> bool:
         if not commit_sha:
             return False
-        store = self._commit_store()
-        key = f"{project_id}:{mr_iid}"
-        seen: list[str] = store.get(key, [])
-        return commit_sha in set(seen)
+        return self._has_marker("mr_commits.json", project_id, mr_iid, commit_sha)
 
     def _mark_local_commit_processed(self, project_id: int, mr_iid: int, commit_sha: str) -> None:
         if not commit_sha:
             return
-        store = self._commit_store()
-        key = f"{project_id}:{mr_iid}"
-        seen: list[str] = store.get(key, [])
-        if commit_sha not in seen:
-            seen.append(commit_sha)
-            store[key] = seen
-            save_json("mr_commits.json", store)
+        self._add_marker("mr_commits.json", project_id, mr_iid, commit_sha)
 
     def _make_gitlab_service(self, project_id: int) -> VCSService:
         if self._service is not None:
@@ -78,7 +78,7 @@ def _maybe_create_jira_issue(cfg: AppConfig, service: GitLabService, args: argpa
 
 
 def cmd_register_hooks(args: argparse.Namespace) -> None:
-	cfg = AppConfig()
+	cfg = AppConfig.load()
 	processor = build_services(cfg)
 	service = processor.service
 	if args.project_id:
@@ -102,14 +102,14 @@ def cmd_register_hooks(args: argparse.Namespace) -> None:
 
 
 def cmd_serve(args: argparse.Namespace) -> None:
-	cfg = AppConfig()
+	cfg = AppConfig.load()
 	processor = build_services(cfg)
 	app = create_app(processor)
 	uvicorn.run(app, host=cfg.host, port=cfg.port, log_level="debug")
 
 
 def cmd_list_projects(args: argparse.Namespace) -> None:
-	cfg = AppConfig()
+	cfg = AppConfig.load()
 	service = GitLabService(cfg.gitlab_url, cfg.gitlab_token)
 	for p in service.list_membership_projects():
 		default_branch = getattr(p, "default_branch", None)
@@ -117,7 +117,7 @@ def cmd_list_projects(args: argparse.Namespace) -> None:
 
 
 def cmd_test_mr(args: argparse.Namespace) -> None:
-	cfg = AppConfig()
+	cfg = AppConfig.load()
 	service = GitLabService(cfg.gitlab_url, cfg.gitlab_token)
 	res = service.create_test_mr(
 		project_id=int(args.project_id),
@@ -131,7 +131,7 @@ def cmd_test_mr(args: argparse.Namespace) -> None:
 
 
 def cmd_test_mr2(args: argparse.Namespace) -> None:
-	cfg = AppConfig()
+	cfg = AppConfig.load()
 	service = GitLabService(cfg.gitlab_url, cfg.gitlab_token)
 	res = service.create_test_mr_v2(
 		project_id=int(args.project_id),
@@ -158,7 +158,7 @@ def build_arg_parser() -> argparse.ArgumentParser:
 	p_ls.set_defaults(func=cmd_list_projects)
 
 	def cmd_list_jira_projects(_: argparse.Namespace) -> None:
-		cfg = AppConfig()
+		cfg = AppConfig.load()
 		if not (cfg.jira_url and cfg.jira_email and cfg.jira_api_token):
 			print("Jira is not configured. Set JIRA_URL, JIRA_EMAIL, JIRA_API_TOKEN.")
 			return
@@ -35,6 +35,9 @@ class FakeProcessor:
 def tmp_data_dir(tmp_path, monkeypatch):
 	# Force isolated data dir per test
 	monkeypatch.setenv("DATA_DIR", str(tmp_path))
+	# Drop in-process document caches from previous tests before the store is swapped
+	from app.storage import cached_store
+	cached_store.clear()
 	# Reload storage to pick up new DATA_DIR
 	from app.storage import json_store as js
 	importlib.reload(js)
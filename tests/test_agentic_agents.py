@@ -1,3 +1,5 @@
+from types import SimpleNamespace
+
 from app.review.agentic.agents.code_agent import CodeSummaryAgent
 from app.review.agentic.agents.diagram_agent import DiagramAgent
 from app.review.agentic.agents.naming_agent import NamingQualityAgent
@@ -102,3 +104,83 @@ def test_diagram_agent_wraps_mermaid_block():
 	assert wrapped.strip().endswith("```")
 
 
+def test_parse_findings_skips_invalid_items():
+	from app.review.agentic.agents.base import parse_findings
+	items = [
+		{"path": "a.py", "line": 3, "comment": " ok "},
+		{"path": "b.py", "line": "4", "comment": "coerced"},
+		{"path": "f.py", "line": 12.0, "comment": "integral float"},
+		{"path": "g.py", "line": 1.5, "comment": "fractional"},
+		{"path": "c.py", "line": 0, "comment": "zero"},
+		{"path": "", "line": 1, "comment": "no path"},
+		{"path": "d.py", "line": "x", "comment": "bad line"},
+		{"path": "e.py", "line": 2, "comment": "  "},
+		"junk",
+	]
+	found = parse_findings(items, "src")
+	assert [(f.path, f.line, f.body, f.source) for f in found] == [
+		("a.py", 3, "ok", "src"),
+		("b.py", 4, "coerced", "src"),
+		("f.py", 12, "integral float", "src"),
+	]
+	assert parse_findings(None, "src") == []
+
+
+def test_payload_blobs_are_rendered_once_per_shape():
+	p = _payload()
+	numbered = p.files_with_line_numbers(max_files=8, max_lines=300)
+	assert numbered.startswith("File: a.py\n0001: print('a')")
+	assert p.files_with_line_numbers(max_files=8, max_lines=300) is numbered
+	assert p.files_blob() is p.files_blob()
+	assert p.files_blob(max_files=1) == "File: a.py\nprint('a')"
+	assert p.commits_blob() is p.commits_blob()
+
+
+def test_numbered_files_respect_token_budget():
+	p = _payload()
+	p.changed_files = [("big.py", "\n".join(f"x = {i}" for i in range(100)))]
+	full = p.files_with_line_numbers(max_files=8, max_lines=300)
+	capped = p.files_with_line_numbers(max_files=8, max_lines=300, max_tokens=10)
+	assert full.count("\n") == 100
+	assert capped.startswith("File: big.py\n0001: x = 0")
+	assert len(capped) <= len("File: big.py\n") + 40
+
+
+def test_strip_code_fence_handles_plain_and_truncated_output():
+	from app.utils.text import strip_code_fence
+
+	assert strip_code_fence('  {"a": 1}\n') == '{"a": 1}'
+	assert strip_code_fence('```json\n{"a": 1}\n```') == '{"a": 1}'
+	assert strip_code_fence('```\n{"a": 1}') == '{"a": 1}'
+	assert strip_code_fence('```{"a": 1}```') == '{"a": 1}'
+
+
+def test_strip_code_fence_keeps_content_on_the_opening_line():
+	from app.utils.text import strip_code_fence
+
+	assert strip_code_fence('```{\n"summary": "s"}\n```') == '{\n"summary": "s"}'
+	assert strip_code_fence('```json {"summary": ["a"],\n"findings": []}\n```') == '{"summary": ["a"],\n"findings": []}'
+	assert strip_code_fence('```json   [\n"bug"]') == '[\n"bug"]'
+
+
+def test_numbered_files_stop_at_max_lines():
+	p = _payload()
+	p.changed_files = [("gen.py", "\r\n".join(f"v{i}" for i in range(10_000)))]
+	out = p.files_with_line_numbers(max_files=8, max_lines=3)
+	assert out == "File: gen.py\n0001: v0\n0002: v1\n0003: v2"
+
+
+def test_discussion_agent_resolves_model_on_first_reply(monkeypatch):
+	from app.review.agentic.agents import discussion_agent as mod
+	calls: list[tuple[str, str]] = []
+
+	class FakeModel:
+		def generate_content(self, prompt):
+			return SimpleNamespace(text=" reply ")
+
+	monkeypatch.setattr(mod, "get_model", lambda api_key, name: calls.append((api_key, name)) or FakeModel())
+	agent = mod.DiscussionAgent(model="gemini", api_key="key")
+	assert calls == []
+	assert agent.generate_reply("note", "answer") == "reply"
+	assert agent.generate_reply("note", "again") == "reply"
+	assert calls == [("key", "gemini")]
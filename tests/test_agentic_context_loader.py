@@ -26,3 +26,10 @@ def test_load_context_valid_json(tmp_path):
 	assert ctx.testing_standards == "x"
 
 
+def test_load_context_is_cached_until_file_changes(tmp_path):
+	p = tmp_path / "ctx.json"
+	p.write_text(json.dumps({"name": "Demo"}), encoding="utf-8")
+	first = load_project_context(str(p))
+	assert load_project_context(str(p)) is first
+	p.write_text(json.dumps({"name": "Renamed"}), encoding="utf-8")
+	assert load_project_context(str(p)).name == "Renamed"
@@ -81,3 +81,61 @@ def test_generator_fallback_when_llm_unavailable(tmp_path):
 	assert "Agentic pipeline unavailable" in output.comments[0].body
 
 
+def test_generator_batches_prompt_agents_and_retries_failures(tmp_path):
+	from app.review.agentic.agents.base import BaseAgent
+
+	class PromptAgent(BaseAgent):
+		def build_prompt(self, payload: AgentPayload) -> str:
+			return self.key
+
+	class BatchModel:
+		def __init__(self) -> None:
+			self.batches = []
+			self.invokes = 0
+
+		def batch(self, inputs, config=None, return_exceptions=False):
+			self.batches.append([msgs[0].content for msgs in inputs])
+			return ["- task" if msgs[0].content == "task_context" else RuntimeError("flaky") for msgs in inputs]
+
+		def invoke(self, messages):
+			self.invokes += 1
+			return "- code"
+
+	ctx_path = _write_context(tmp_path)
+	gen = AgenticReviewGenerator(provider="openai", model="gpt", openai_api_key="x", google_api_key=None, project_context_path=ctx_path, timeout=1.0)
+	model = BatchModel()
+	gen.client.model = model
+	gen.agents = [PromptAgent("task_context", "Task"), PromptAgent("code_summary", "Code")]
+	output = gen.generate_review(**_payload())
+	assert model.batches == [["task_context", "code_summary"]]
+	assert model.invokes == 1
+	summary = next(c for c in output.comments if c.title == "Task and Diff Summary")
+	assert "task" in summary.body and "code" in summary.body
+
+
+def test_generator_reuses_results_for_identical_prompts(tmp_path):
+	from app.review.agentic.agents.base import BaseAgent
+
+	class PromptAgent(BaseAgent):
+		def build_prompt(self, payload: AgentPayload) -> str:
+			return f"{self.key}:{payload.diff_text}"
+
+	class CountingModel:
+		def __init__(self) -> None:
+			self.prompts = []
+
+		def batch(self, inputs, config=None, return_exceptions=False):
+			self.prompts.extend(msgs[0].content for msgs in inputs)
+			return ["- ok" for _ in inputs]
+
+	ctx_path = _write_context(tmp_path)
+	gen = AgenticReviewGenerator(provider="openai", model="gpt", openai_api_key="x", google_api_key=None, project_context_path=ctx_path, timeout=1.0)
+	model = CountingModel()
+	gen.client.model = model
+	gen.agents = [PromptAgent("task_context", "Task")]
+	gen.generate_review(**_payload())
+	gen.generate_review(**_payload())
+	assert model.prompts == ["task_context:diff --git a b"]
+	changed = dict(_payload(), diff_text="diff --git c d")
+	gen.generate_review(**changed)
+	assert model.prompts[-1] == "task_context:diff --git c d"
@@ -37,3 +37,45 @@ def test_llm_client_extracts_text_attr():
 	assert out == "T"
 
 
+def test_llm_client_generate_as_completed_falls_back_to_batch():
+	class BatchModel:
+		def __init__(self) -> None:
+			self.calls = []
+
+		def batch(self, inputs, config=None, return_exceptions=False):
+			self.calls.append((len(inputs), config, return_exceptions))
+			return ["first", ValueError("boom")]
+	model = BatchModel()
+	client = LLMClient(model=model)
+	out = list(client.generate_as_completed(["a", "b"], max_concurrency=2))
+	assert out[0] == (0, "first")
+	assert out[1][0] == 1 and isinstance(out[1][1], ValueError)
+	assert model.calls == [(2, {"max_concurrency": 2}, True)]
+
+
+def test_llm_client_generate_as_completed_yields_in_arrival_order():
+	class StreamingModel:
+		def batch_as_completed(self, inputs, config=None, return_exceptions=False):
+			yield 1, "second prompt answered first"
+			yield 0, "first"
+	client = LLMClient(model=StreamingModel())
+	assert list(client.generate_as_completed(["a", "b"])) == [(1, "second prompt answered first"), (0, "first")]
+
+
+def test_openai_models_share_one_http_pool():
+	from app.review.agentic.llm import build_llm_client
+
+	first = build_llm_client("openai", "gpt", "key", None, 5.0)
+	second = build_llm_client("openai", "gpt", "key", None, 5.0)
+	assert first.model is not second.model
+	assert first.model.http_client is second.model.http_client
+
+
+def test_close_http_clients_closes_and_forgets_shared_pools():
+	from app.review.agentic.llm import build_llm_client, close_http_clients
+
+	pool = build_llm_client("openai", "gpt", "key", None, 5.0).model.http_client
+	close_http_clients()
+	assert pool.is_closed
+	assert build_llm_client("openai", "gpt", "key", None, 5.0).model.http_client is not pool
+	close_http_clients()
@@ -0,0 +1,30 @@
+import asyncio
+import threading
+
+from app.auth import middleware
+
+
+def test_cancelled_leader_does_not_cancel_concurrent_waiters(monkeypatch):
+	release = threading.Event()
+	calls: list[str] = []
+
+	def fake_authenticate(token, origin, referer):
+		calls.append(token)
+		release.wait(5)
+		return {"user_id": "u1"}
+
+	monkeypatch.setattr(middleware, "authenticate_token", fake_authenticate)
+
+	async def scenario():
+		leader = asyncio.create_task(middleware._authenticate_once("tok", None, None))
+		await asyncio.sleep(0.01)
+		waiter = asyncio.create_task(middleware._authenticate_once("tok", None, None))
+		await asyncio.sleep(0.01)
+		leader.cancel()
+		await asyncio.sleep(0.01)
+		release.set()
+		return await waiter, leader.cancelled()
+
+	assert asyncio.run(scenario()) == ({"user_id": "u1"}, True)
+	assert calls == ["tok"]
+	assert not middleware._inflight
@@ -0,0 +1,30 @@
+import json
+
+import jwt
+from clerk_backend_api import models
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+from app.auth import service
+
+
+def test_get_jwt_key_fetches_jwks_once_per_kid(monkeypatch):
+	private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+	jwk = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+	calls: list[int] = []
+
+	class FakeJwks:
+		def get_jwks(self):
+			calls.append(1)
+			return models.Jwks(keys=[models.Keys(kid="k1", **jwk)])
+
+	monkeypatch.setattr(service, "clerk_secret_key", "sk_test")
+	monkeypatch.setattr(service.clerk_client, "jwks", FakeJwks())
+	monkeypatch.setattr(service, "_jwt_keys", {})
+	token = jwt.encode({"sub": "u1"}, private_key, algorithm="RS256", headers={"kid": "k1"})
+
+	pem = service.get_jwt_key(token)
+	assert jwt.decode(token, pem, algorithms=["RS256"])["sub"] == "u1"
+	assert service.get_jwt_key(token) == pem
+	assert calls == [1]
+	assert service.get_jwt_key(jwt.encode({}, private_key, algorithm="RS256", headers={"kid": "other"})) is None
@@ -0,0 +1,34 @@
+import time
+
+from app.auth.token_cache import TokenCache
+
+
+def test_token_cache_hit_respects_authorized_parties():
+	cache = TokenCache(maxsize=4)
+	claims = {"sub": "u1", "azp": "http://localhost:3000", "exp": time.time() + 60}
+	cache.put("tok", claims)
+	assert cache.get("tok", ["http://localhost:3000"]) == claims
+	assert cache.get("tok", ["https://evil.example"]) is None
+	assert cache.get("other", ["http://localhost:3000"]) is None
+
+
+def test_token_cache_skips_and_evicts_expired_tokens():
+	cache = TokenCache(maxsize=4)
+	cache.put("old", {"sub": "u1", "exp": time.time() - 1})
+	assert cache.get("old", []) is None
+	cache.put("soon", {"sub": "u2", "exp": time.time() + 60})
+	cache._entries[cache._key("soon")] = ({"sub": "u2"}, time.time() - 1)
+	assert cache.get("soon", []) is None
+	assert not cache._entries
+
+
+def test_token_cache_is_bounded_lru():
+	cache = TokenCache(maxsize=2)
+	exp = time.time() + 60
+	cache.put("a", {"sub": "a", "exp": exp})
+	cache.put("b", {"sub": "b", "exp": exp})
+	assert cache.get("a", []) is not None
+	cache.put("c", {"sub": "c", "exp": exp})
+	assert cache.get("b", []) is None
+	assert cache.get("a", []) is not None
+	assert cache.get("c", []) is not None
@@ -0,0 +1,66 @@
+from app.integrations import gemini_client
+from app.tagging import gemini_classifier
+from app.tagging.gemini_classifier import GeminiTagClassifier
+
+
+class FakeGenai:
+	def __init__(self) -> None:
+		self.calls = 0
+		self.prompts = []
+
+	def configure(self, api_key=None):
+		pass
+
+	def GenerativeModel(self, name):
+		fake = self
+
+		class Model:
+			def generate_content(self, prompt):
+				fake.calls += 1
+				fake.prompts.append(prompt)
+
+				class Resp:
+					text = '```json\n["Bug", "docs", "nope"]\n```'
+
+				return Resp()
+
+		return Model()
+
+
+def _classify(clf, diff_text="diff"):
+	return clf.classify("Fix crash", "desc", diff_text, [("a.py", "x = 1")], ["fix"], ["bug", "docs", "test"])
+
+
+def test_classifier_reuses_labels_for_identical_input(monkeypatch):
+	fake = FakeGenai()
+	monkeypatch.setenv("ENV", "prod")
+	monkeypatch.setattr(gemini_classifier, "_HAS_GEMINI", True)
+	monkeypatch.setattr(gemini_client, "genai", fake)
+	monkeypatch.setattr(gemini_client, "_MODELS", {})
+	monkeypatch.setattr(gemini_client, "_configured_key", None)
+	clf = GeminiTagClassifier(api_key="k", model="m", max_labels=2)
+	assert _classify(clf) == ["bug", "docs"]
+	assert _classify(clf) == ["bug", "docs"]
+	assert fake.calls == 1
+	_classify(clf, diff_text="other diff")
+	assert fake.calls == 2
+
+
+def test_classifier_bounds_file_content_in_prompt(monkeypatch):
+	fake = FakeGenai()
+	monkeypatch.setenv("ENV", "prod")
+	monkeypatch.setattr(gemini_classifier, "_HAS_GEMINI", True)
+	monkeypatch.setattr(gemini_client, "genai", fake)
+	monkeypatch.setattr(gemini_client, "_MODELS", {})
+	monkeypatch.setattr(gemini_client, "_configured_key", None)
+	clf = GeminiTagClassifier(api_key="k", model="m")
+	big = "x" * 100_000
+	clf.classify("t", "d", "diff", [("big.py", big)], [], ["bug"])
+	assert len(fake.prompts[0]) < gemini_classifier._MAX_FILE_CHARS + 2_000
+
+
+def test_dev_classify_scans_keywords_in_priority_order(monkeypatch):
+	monkeypatch.setenv("ENV", "dev")
+	clf = GeminiTagClassifier(api_key=None, model="m", max_labels=3)
+	labels = clf.classify("Add README section", "perFIX latency", "", [], [], ["Feature", "docs", "bug", "perf"])
+	assert labels == ["bug", "docs", "perf"]
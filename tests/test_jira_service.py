@@ -0,0 +1,108 @@
+from app.integrations import jira_service
+from app.integrations.jira_service import JiraService
+
+
+def _service(max_issues: int = 5) -> JiraService:
+	svc = JiraService.__new__(JiraService)
+	svc.base_url = "https://jira.example"
+	svc.email = "e"
+	svc.api_token = "t"
+	svc.project_keys = ["KZKP"]
+	svc.max_issues = max_issues
+	svc.search_window = "-30d"
+	jira_service._SEARCH_CACHE.clear()
+	return svc
+
+
+def test_search_related_issues_builds_queries_and_merges_in_priority_order():
+	svc = _service()
+	seen_jql: list[str] = []
+
+	def fake_post(path, body):
+		assert path == "/rest/api/3/search/jql"
+		jql = body["jql"]
+		seen_jql.append(jql)
+		assert body["maxResults"] == 5
+		if "description ~" in jql:
+			return {"issues": [{"key": "KZKP-1", "fields": {"summary": "url", "status": {"name": "Open"}, "updated": "u"}}]}
+		if "text ~" in jql:
+			return {"issues": [
+				{"key": "KZKP-2", "fields": {"summary": "text", "status": {"name": "Done"}, "updated": "u"}},
+				{"key": "KZKP-1", "fields": {"summary": "dup", "status": {"name": "Open"}, "updated": "u"}},
+			]}
+		return {"issues": [{"key": "KZKP-3", "fields": {"summary": "label", "status": {"name": "Open"}, "updated": "u"}}]}
+
+	svc._post_json = fake_post
+	out = svc.search_related_issues(
+		title="Fix payment retry logic",
+		description="Payment gateway retries",
+		labels=["bug", "bug", "payments"],
+		created_at_iso="2025-01-02T00:00:00Z",
+		mr_url="https://gitlab/mr/1",
+	)
+	assert [i["key"] for i in out] == ["KZKP-1", "KZKP-2", "KZKP-3"]
+	assert out[0]["summary"] == "url"
+	assert out[1]["url"] == "https://jira.example/browse/KZKP-2"
+	assert len(seen_jql) == 3
+	for jql in seen_jql:
+		assert jql.startswith('project in (KZKP) AND updated >= -30d AND created >= "2025-01-02" AND (')
+		assert jql.endswith(") ORDER BY updated DESC")
+	text_jql = next(j for j in seen_jql if "text ~" in j)
+	assert 'text ~ "payment"' in text_jql and 'text ~ "retries"' in text_jql
+	assert text_jql.count('"payment"') == 1
+
+
+def test_search_related_issues_bulkfetches_missing_fields_and_caps_results():
+	svc = _service(max_issues=1)
+
+	def fake_post(path, body):
+		if path.endswith("/bulkfetch"):
+			return {"issues": [{"key": "KZKP-9", "fields": {"summary": "filled", "status": {"name": "Open"}, "updated": "u"}}]}
+		return {"issues": [{"key": "KZKP-9"}, {"key": "KZKP-10"}]}
+
+	svc._post_json = fake_post
+	out = svc.search_related_issues(title="abc", description="", labels=[], created_at_iso=None)
+	assert out == [{"key": "KZKP-9", "summary": "filled", "status": "Open", "updated": "u", "url": "https://jira.example/browse/KZKP-9"}]
+
+
+def test_search_related_issues_falls_back_to_issue_picker(monkeypatch):
+	svc = _service()
+	monkeypatch.setattr("app.integrations.jira_service.time.sleep", lambda s: None)
+
+	def failing_post(path, body):
+		raise RuntimeError("HTTP 500")
+
+	svc._post_json = failing_post
+	svc._get_json = lambda path, params=None: {"issues": [{"key": "KZKP-7", "summary": "picked"}]}
+	out = svc.search_related_issues(title="", description="", labels=["ops"], created_at_iso=None)
+	assert [i["key"] for i in out] == ["KZKP-7"]
+	assert out[0]["summary"] == "picked"
+
+
+def test_to_adf_builds_fresh_paragraph_docs():
+	doc = jira_service._to_adf("one\ntwo\n\nthree")
+	assert doc["content"] == [
+		{"type": "paragraph", "content": [{"type": "text", "text": "one"}, {"type": "hardBreak"}, {"type": "text", "text": "two"}]},
+		{"type": "paragraph", "content": [{"type": "text", "text": "three"}]},
+	]
+	assert jira_service._to_adf("one\ntwo\n\nthree") is not doc
+	assert jira_service._to_adf("  ")["content"] == [{"type": "paragraph", "content": [{"type": "text", "text": ""}]}]
+
+
+def test_search_related_issues_reuses_recent_results(monkeypatch):
+	svc = _service()
+	calls: list[str] = []
+
+	def fake_post(path, body):
+		calls.append(body["jql"])
+		return {"issues": [{"key": "KZKP-7", "fields": {"summary": "s", "status": {"name": "Open"}, "updated": "u"}}]}
+
+	svc._post_json = fake_post
+	first = svc.search_related_issues("Fix login", "", ["ops"], None)
+	assert svc.search_related_issues("Fix login", "", ["ops"], None) == first
+	assert len(calls) == 2
+	svc.search_related_issues("Fix logout", "", ["ops"], None)
+	assert len(calls) == 4
+	monkeypatch.setattr(jira_service, "_SEARCH_CACHE_TTL_SECONDS", 0.0)
+	svc.search_related_issues("Fix login", "", ["ops"], None)
+	assert len(calls) == 6
@@ -0,0 +1,45 @@
+from types import SimpleNamespace
+
+from gitlab.exceptions import GitlabAuthenticationError
+
+from app.repos import service as repos_service
+from app.storage import cached_store, json_store
+
+
+class FakeGitlab:
+	projects_by_token = {
+		"t1": [SimpleNamespace(id=2, name="Beta", path_with_namespace="G/Beta", visibility="private", description="")],
+		"t2": [
+			SimpleNamespace(id=1, name="alpha", path_with_namespace="g/alpha", visibility="public", description="x"),
+			SimpleNamespace(id=2, name="Beta", path_with_namespace="G/Beta", visibility="private", description=""),
+		],
+	}
+
+	def __init__(self, url, private_token):
+		self.token = private_token
+		self.projects = SimpleNamespace(list=lambda **kw: self.projects_by_token[self.token])
+
+	def auth(self):
+		if self.token == "revoked":
+			raise GitlabAuthenticationError(response_code=401)
+
+
+def test_sync_repositories_merges_tokens_and_skips_revoked(monkeypatch):
+	docs: dict[str, dict] = {"tokens.json": {"u1": [
+		{"id": "a", "token": "t1"},
+		{"id": "b", "token": "revoked"},
+		{"id": "c", "token": "t2"},
+		{"id": "d"},
+	]}}
+	monkeypatch.setattr(json_store, "load_json", lambda name, default: docs.get(name, default))
+	monkeypatch.setattr(json_store, "save_json", docs.__setitem__)
+	monkeypatch.setattr(json_store, "document_version", lambda name: None)
+	cached_store.clear()
+	monkeypatch.setattr(repos_service.gitlab, "Gitlab", FakeGitlab)
+
+	assert repos_service.sync_repositories("u1") == 2
+	repos = repos_service.load_repos("u1")
+	assert [r["gitlab_repo_id"] for r in repos] == [1, 2]
+	assert repos[1]["name_lc"] == "beta"
+	assert repos[1]["full_path_lc"] == "g/beta"
+	cached_store.clear()
@@ -0,0 +1,36 @@
+from app.storage import cached_store, json_store
+
+
+def test_cached_store_reuses_document_until_version_changes(monkeypatch):
+	loads: list[str] = []
+	version = {"tokens.json": 1}
+	monkeypatch.setattr(json_store, "load_json", lambda name, default: loads.append(name) or {"u": [1]})
+	monkeypatch.setattr(json_store, "document_version", version.get)
+	cached_store.clear()
+
+	first = cached_store.get_cache("tokens.json")
+	assert cached_store.get_cache("tokens.json") is first
+	assert loads == ["tokens.json"]
+
+	version["tokens.json"] = 2
+	assert cached_store.get_cache("tokens.json") is not first
+	assert loads == ["tokens.json", "tokens.json"]
+	cached_store.clear()
+
+
+def test_cached_store_update_saves_before_returning(monkeypatch):
+	docs: dict[str, dict] = {}
+	saves: list[str] = []
+	monkeypatch.setattr(json_store, "load_json", lambda name, default: dict(docs.get(name, default)))
+	monkeypatch.setattr(json_store, "save_json", lambda name, data: saves.append(name) or docs.__setitem__(name, data))
+	monkeypatch.setattr(json_store, "document_version", lambda name: saves.count(name))
+	cached_store.clear()
+
+	cached_store.update("tokens.json", lambda d: d.setdefault("u", []).append(1))
+	assert docs["tokens.json"] == {"u": [1]}
+	assert cached_store.get_cache("tokens.json") == {"u": [1]}
+
+	cached_store.update("tokens.json", lambda d: d.update(v=2))
+	assert docs["tokens.json"] == {"u": [1], "v": 2}
+	assert cached_store.get_cache("tokens.json") == {"u": [1], "v": 2}
+	cached_store.clear()
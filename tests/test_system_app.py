@@ -100,7 +100,7 @@ def test_system_bootstrap_and_webhook_processing_posts_note(monkeypatch):
 	# Build via real bootstrap and run app as in production (in-memory server)
 	from app.config.config import AppConfig
 	from app.server.http import create_app
-	processor = bs.build_services(AppConfig())
+	processor = bs.build_services(AppConfig.from_env())
 	app = create_app(processor)
 	from fastapi.testclient import TestClient
 	client = TestClient(app, follow_redirects=False)
@@ -142,7 +142,7 @@ def test_system_endpoints_exist_and_cors(monkeypatch):
 
 	from app.config.config import AppConfig
 	from app.server.http import create_app
-	processor = bs.build_services(AppConfig())
+	processor = bs.build_services(AppConfig.from_env())
 	app = create_app(processor)
 	from fastapi.testclient import TestClient
 	client = TestClient(app, follow_redirects=False)
@@ -0,0 +1,20 @@
+from app.storage import cached_store, json_store
+from app.webhook import processor as processor_mod
+
+
+def test_commit_markers_are_capped_and_visible_after_save(monkeypatch):
+	docs: dict[str, dict] = {}
+	saves: list[str] = []
+	monkeypatch.setattr(json_store, "load_json", lambda name, default: dict(docs.get(name, default)))
+	monkeypatch.setattr(json_store, "save_json", lambda name, data: saves.append(name) or docs.__setitem__(name, data))
+	monkeypatch.setattr(json_store, "document_version", lambda name: saves.count(name))
+	cached_store.clear()
+	proc = processor_mod.WebhookProcessor(reviewer=None, webhook_secret="s")
+
+	assert not proc._has_local_commit_marker(1, 2, "sha0")
+	for i in range(processor_mod._MAX_MARKERS_PER_MR + 1):
+		proc._mark_local_commit_processed(1, 2, f"sha{i}")
+	assert proc._has_local_commit_marker(1, 2, f"sha{processor_mod._MAX_MARKERS_PER_MR}")
+	assert not proc._has_local_commit_marker(1, 2, "sha0")
+	assert len(docs["mr_commits.json"]["1:2"]) == processor_mod._MAX_MARKERS_PER_MR
+	cached_store.clear()